@@ -14,6 +14,7 @@ import sys
 import zipfile
 import lameenc
 from PIL import Image
+from common.inventory_hatch import create_inventory_hatch_image
 
 
 # ============================================================================
@@ -879,6 +880,21 @@ def extract_icons(output_base):
     return count
 
 
+def create_inventory_hatch(output_base):
+    """Create the cross-hatch overlay drawn over non-selected inventory icons.
+
+    Uses the same builder as HeaderRenderer's fallback (common.inventory_hatch).
+    """
+    sprites_dir = os.path.join(output_base, 'sprites')
+    os.makedirs(sprites_dir, exist_ok=True)
+
+    hatch = create_inventory_hatch_image()
+    hatch.save(os.path.join(sprites_dir, "inventory_hatch.png"))
+
+    print("  Created inventory hatch")
+    return 1
+
+
 def extract_player_cards(output_base):
     """Extract player cards and icon separator from PLAYERS.png"""
     players_path = os.path.join(output_base, 'graphics', 'PLAYERS.png')
@@ -1085,6 +1101,7 @@ def main():
     sprite_count = split_sprites(output_base)
     player_card_count = extract_player_cards(output_base)
     icon_count = extract_icons(output_base)
+    icon_count += create_inventory_hatch(output_base)
     font_count = extract_bitmap_font(zip_path, output_base)
     padded_count = pad_sprites(output_base)
     bg_removed_count = remove_background_color(output_base)
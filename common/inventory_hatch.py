@@ -0,0 +1,14 @@
+import numpy as np
+from PIL import Image
+
+# Cross-hatch overlay drawn over non-selected inventory icons
+HATCH_SIZE = 30
+HATCH_COLOR = (103, 103, 103, 255)  # Grey #676767
+
+
+def create_inventory_hatch_image() -> Image.Image:
+    """Build the 30x30 transparent hatch image with a grey pixel on every 4th diagonal."""
+    hatch_pixels = np.zeros((HATCH_SIZE, HATCH_SIZE, 4), dtype=np.uint8)
+    hatch_axis = np.arange(HATCH_SIZE)
+    hatch_pixels[np.add.outer(hatch_axis, hatch_axis) % 4 == 0] = HATCH_COLOR
+    return Image.fromarray(hatch_pixels, 'RGBA')
@@ -112,6 +112,9 @@ INDESTRUCTIBLE_TILE_TYPES = {'tunnel', 'concrete', 'switch', 'security_door'}
 
 # Get tile IDs from the dictionary
 EMPTY_TILE_ID = next(tile_id for tile_id, name in TILE_DICTIONARY.items() if name == 'empty')
+EMPTY_TILE_IDS = tuple(sorted(tile_id for tile_id, name in TILE_DICTIONARY.items() if name in EMPTY_TILE_NAMES))
+BEDROCK_TILE_IDS = tuple(sorted(tile_id for tile_id, name in TILE_DICTIONARY.items() if name in BEDROCK_TILE_NAMES))
+DIRT_TILE_IDS = tuple(sorted(tile_id for tile_id, name in TILE_DICTIONARY.items() if name in DIRT_TILE_NAMES))
 ROCK1_TILE_ID = next(tile_id for tile_id, name in TILE_DICTIONARY.items() if name == 'rock1')
 ROCK2_TILE_ID = next(tile_id for tile_id, name in TILE_DICTIONARY.items() if name == 'rock2')
 BRICS2_TILE_ID = next(tile_id for tile_id, name in TILE_DICTIONARY.items() if name == 'brics2')
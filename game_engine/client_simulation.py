@@ -38,6 +38,9 @@ class ClientSimulation:
         self._server_state_time: float = 0.0
         self._prev_server_time: float = 0.0  # Previous state's server_time
         self._accumulated_explosions: Optional[np.ndarray] = None
+        # Buffer handed out by the previous get_render_state call; reused as
+        # the next accumulator so explosions never need a fresh allocation.
+        self._spare_explosions: Optional[np.ndarray] = None
         self._sound_engine = sound_engine
         # Guards the shared fields above. receive_state runs on the network
         # thread while get_render_state runs on the render thread; without this
@@ -54,11 +57,10 @@ class ClientSimulation:
         client-side extrapolation is immune to variable network/processing delays.
         """
         with self._lock:
-            if self._accumulated_explosions is not None:
-                # Merge: new explosions take priority, keep old where new is zero
-                self._accumulated_explosions = np.where(
-                    state.explosions > 0, state.explosions, self._accumulated_explosions
-                )
+            accumulated = self._accumulated_explosions
+            if accumulated is not None and accumulated.shape == state.explosions.shape:
+                # Merge in place: new explosions take priority, keep old where new is zero
+                np.copyto(accumulated, state.explosions, where=state.explosions > 0)
             else:
                 self._accumulated_explosions = state.explosions.copy()
 
@@ -115,7 +117,15 @@ class ClientSimulation:
                 return None
             server_state_time = self._server_state_time
             explosions = self._accumulated_explosions
-            self._accumulated_explosions = np.zeros_like(explosions)
+            # Swap buffers: the returned array stays valid until the next
+            # call, when it is cleared and becomes the accumulator again.
+            spare = self._spare_explosions
+            if spare is None or spare.shape != explosions.shape:
+                spare = np.zeros_like(explosions)
+            else:
+                spare.fill(0)
+            self._accumulated_explosions = spare
+            self._spare_explosions = explosions
 
         current_time = Clock.now()
         delta_time = min(current_time - server_state_time, MAX_EXTRAPOLATION_TIME)
@@ -4,6 +4,9 @@ Renders text using an 8x8 bitmap font spritesheet.
 """
 
 import os
+from collections import OrderedDict
+from typing import List
+
 import arcade
 from PIL import Image
 
@@ -12,6 +15,9 @@ FONT_CHAR_WIDTH = 8
 FONT_CHAR_HEIGHT = 8
 FONT_CHARS_PER_ROW = 16
 
+# Number of distinct (text, position, color) sprite lists kept by draw_text
+DRAW_TEXT_CACHE_SIZE = 32
+
 
 class BitmapText:
     """Renders text using an 8x8 bitmap font spritesheet.
@@ -56,6 +62,9 @@ class BitmapText:
         # Sprite list for rendering text
         self.sprite_list = arcade.SpriteList()
 
+        # Recently drawn text sprite lists, most recent last
+        self._draw_cache: OrderedDict = OrderedDict()
+
     def create_text_sprites(self, text: str, x: float, y: float,
                             color: tuple = None) -> arcade.SpriteList:
         """Create a sprite list for the given text.
@@ -69,7 +78,7 @@ class BitmapText:
         Returns:
             A SpriteList containing sprites for each character
         """
-        sprite_list = arcade.SpriteList()
+        sprites = []
         current_x = x
 
         for char in text:
@@ -88,22 +97,79 @@ class BitmapText:
             # Position sprite center
             sprite.center_x = current_x + self.char_width / 2
             sprite.center_y = y - self.char_height / 2
+            self._apply_color(sprite, color)
 
-            # Apply color tint if specified
-            if color:
-                sprite.color = color[:3]  # RGB only
-                if len(color) > 3:
-                    sprite.alpha = color[3]
-            elif self.color:
-                sprite.color = self.color[:3]
-                if len(self.color) > 3:
-                    sprite.alpha = self.color[3]
-
-            sprite_list.append(sprite)
+            sprites.append(sprite)
             current_x += self.char_width
 
+        # Sized for the text and filled in one batch
+        sprite_list = arcade.SpriteList(capacity=max(len(sprites), 1))
+        sprite_list.extend(sprites)
         return sprite_list
 
+    def update_text_sprites(self, sprites: List[arcade.Sprite], text: str,
+                            x: float, y: float, color: tuple = None) -> bool:
+        """Rewrite existing character sprites in place to show new text.
+
+        Sprites in ``sprites`` are reused in order; surplus ones are hidden
+        and missing ones are created and appended to the list.
+
+        Args:
+            sprites: Character sprites previously used for this text slot
+            text: The text string to render
+            x: X position of the text (left edge)
+            y: Y position of the text (top edge)
+            color: Optional RGBA color override
+
+        Returns:
+            True if sprites were appended, so the caller's SpriteList needs them too
+        """
+        grew = False
+        index = 0
+        current_x = x
+
+        for char in text:
+            char_code = ord(char)
+            if char_code > 255:
+                char_code = ord('?')  # Fallback for non-ASCII
+
+            texture = self.char_textures.get(char_code)
+            if texture is None:
+                current_x += self.char_width
+                continue
+
+            if index < len(sprites):
+                sprite = sprites[index]
+                sprite.visible = True
+            else:
+                sprite = arcade.Sprite()
+                sprite.scale = self.zoom
+                sprites.append(sprite)
+                grew = True
+            sprite.texture = texture
+            sprite.center_x = current_x + self.char_width / 2
+            sprite.center_y = y - self.char_height / 2
+            self._apply_color(sprite, color)
+
+            index += 1
+            current_x += self.char_width
+
+        for sprite in sprites[index:]:
+            sprite.visible = False
+
+        return grew
+
+    def _apply_color(self, sprite: arcade.Sprite, color: tuple = None):
+        """Tint a character sprite with the given or default color."""
+        if color:
+            sprite.color = color[:3]  # RGB only
+            if len(color) > 3:
+                sprite.alpha = color[3]
+        elif self.color:
+            sprite.color = self.color[:3]
+            if len(self.color) > 3:
+                sprite.alpha = self.color[3]
+
     def draw_text(self, text: str, x: float, y: float, color: tuple = None):
         """Draw text at the specified position.
 
@@ -113,7 +179,17 @@ class BitmapText:
             y: Y position of the text (top edge)
             color: Optional RGBA color override
         """
-        sprite_list = self.create_text_sprites(text, x, y, color)
+        # Overlay text is redrawn every frame with the same few strings, so
+        # the built sprite lists are kept in a small LRU cache
+        key = (text, x, y, color)
+        sprite_list = self._draw_cache.get(key)
+        if sprite_list is None:
+            sprite_list = self.create_text_sprites(text, x, y, color)
+            self._draw_cache[key] = sprite_list
+            if len(self._draw_cache) > DRAW_TEXT_CACHE_SIZE:
+                self._draw_cache.popitem(last=False)
+        else:
+            self._draw_cache.move_to_end(key)
         sprite_list.draw(pixelated=True)
 
     def get_text_width(self, text: str) -> float:
@@ -4,9 +4,12 @@ Handles player, monster, pickup, bomb, and explosion rendering.
 """
 
 import os
+from typing import Dict, TYPE_CHECKING
 
 import arcade
+import numpy as np
 
+from game_engine.clock import Clock
 from game_engine.entities import Direction, EntityType
 from common.bomb_dictionary import BombType
 from game_engine.render_state import RenderState
@@ -18,7 +21,12 @@ from renderer.sprites import (
     BombSprite,
     ExplosionSprite,
 )
+from renderer.sprites.bomb_sprite import build_bomb_texture_table
+from renderer.sprites.monster_sprite import build_monster_texture_table
+from renderer.sprites.pickup_sprite import build_pickup_texture_table
+from renderer.sprites.player_sprite import build_player_texture_table
 from renderer.player_colorizer import PlayerColorizer
+from renderer.tile_renderer import grid_center_positions, pixelated_sprite_list
 from common.tile_dictionary import (
     TILE_DICTIONARY,
     PLAYER_DEATH_SPRITE,
@@ -27,6 +35,9 @@ from common.tile_dictionary import (
     TOOL_TILES,
 )
 
+if TYPE_CHECKING:
+    from renderer.game_renderer import ViewBounds
+
 SPRITE_SIZE = 10
 SPRITE_CENTER_OFFSET = SPRITE_SIZE // 2
 
@@ -35,7 +46,14 @@ class EntityRenderer:
     """Handles player, monster, pickup, bomb, and explosion rendering."""
 
     def __init__(
-        self, state, transparent_texture, zoom, screen_height, map_height, sprites_path
+        self,
+        state,
+        transparent_texture,
+        zoom,
+        screen_height,
+        map_height,
+        sprites_path,
+        tile_atlas=None,
     ):
         self.zoom = zoom
         self.transparent_texture = transparent_texture
@@ -43,13 +61,12 @@ class EntityRenderer:
         self.map_height = map_height
         self.sprites_path = sprites_path
 
+        # sprite_name -> texture, so each PNG is read from disk only once
+        self._texture_cache: Dict[str, arcade.Texture] = {}
+
         # Load death textures
-        self.blood_texture = arcade.load_texture(
-            os.path.join(sprites_path, f"{PLAYER_DEATH_SPRITE}.png")
-        )
-        self.blood_green_texture = arcade.load_texture(
-            os.path.join(sprites_path, f"{MONSTER_DEATH_SPRITE}.png")
-        )
+        self.blood_texture = self._load_cached(PLAYER_DEATH_SPRITE)
+        self.blood_green_texture = self._load_cached(MONSTER_DEATH_SPRITE)
 
         # Use PlayerColorizer for per-player recolored textures
         self.colorizer = PlayerColorizer(sprites_path)
@@ -66,12 +83,11 @@ class EntityRenderer:
             for direction in Direction:
                 for frame in range(1, 5):
                     sprite_name = f"{sprite_prefix}_{direction.value}_{frame}"
-                    path = os.path.join(sprites_path, f"{sprite_name}.png")
-                    texture = arcade.load_texture(path)
+                    texture = self._load_cached(sprite_name)
                     self.monster_textures[(entity_type, direction, frame)] = texture
 
         # Load grenade projectile texture (single static sprite for all directions/frames)
-        grenade_texture = arcade.load_texture(os.path.join(sprites_path, "grenade.png"))
+        grenade_texture = self._load_cached("grenade")
         for direction in Direction:
             for frame in range(1, 5):
                 self.monster_textures[(EntityType.GRENADE, direction, frame)] = (
@@ -84,23 +100,28 @@ class EntityRenderer:
         for tile_id in pickup_tile_ids:
             sprite_name = TILE_DICTIONARY.get(tile_id)
             if sprite_name:
-                path = os.path.join(sprites_path, f"{sprite_name}.png")
-                self.pickup_textures[tile_id] = arcade.load_texture(path)
+                self.pickup_textures[tile_id] = self._load_cached(sprite_name)
+        self.pickup_texture_table = build_pickup_texture_table(
+            self.pickup_textures, transparent_texture
+        )
 
         # Bomb textures: (bomb_type, state, frame) -> texture
         self.bomb_textures = {}
         self._load_bomb_textures()
+        self.bomb_texture_table = build_bomb_texture_table(
+            self.bomb_textures, transparent_texture
+        )
 
         # Explosion textures indexed by frame (0=transparent, 1=explosion, 2=smoke1, 3=smoke2)
         self.explosion_frame_textures = [
             transparent_texture,
-            arcade.load_texture(os.path.join(sprites_path, "explosion.png")),
-            arcade.load_texture(os.path.join(sprites_path, "smoke1.png")),
-            arcade.load_texture(os.path.join(sprites_path, "smoke2.png")),
+            self._load_cached("explosion"),
+            self._load_cached("smoke1"),
+            self._load_cached("smoke2"),
         ]
 
         # Player sprite pool - each player gets their own recolored textures
-        self.player_sprite_list = arcade.SpriteList()
+        self.player_sprite_list = pixelated_sprite_list()
         self.player_sprite_list.initialize()
         self.player_sprites = []
 
@@ -111,7 +132,9 @@ class EntityRenderer:
             self.player_sprite_list.preload_textures(player_textures.values())
             sprite = PlayerSprite(
                 sprite_id=player.sprite_id,
-                player_textures=player_textures,
+                player_textures=build_player_texture_table(
+                    player_textures, transparent_texture
+                ),
                 transparent_texture=transparent_texture,
                 blood_texture=self.blood_texture,
                 zoom=zoom,
@@ -123,15 +146,18 @@ class EntityRenderer:
         self.player_sprite_list.extend(self.player_sprites)
 
         # Monster sprite pool
-        self.monster_sprite_list = arcade.SpriteList()
+        self.monster_sprite_list = pixelated_sprite_list()
         self.monster_sprite_list.initialize()
         self.monster_sprite_list.preload_textures(self.monster_textures.values())
+        self.monster_texture_table = build_monster_texture_table(
+            self.monster_textures, transparent_texture
+        )
         self.monster_sprites = []
 
         for monster in state.monsters:
             sprite = MonsterSprite(
                 entity_type=monster.entity_type,
-                monster_textures=self.monster_textures,
+                monster_textures=self.monster_texture_table,
                 transparent_texture=transparent_texture,
                 blood_green_texture=self.blood_green_texture,
                 zoom=zoom,
@@ -142,15 +168,16 @@ class EntityRenderer:
 
         self.monster_sprite_list.extend(self.monster_sprites)
 
-        # Pickup sprite list (dynamic length)
-        self.pickup_sprite_list = arcade.SpriteList()
+        # Pickup sprite pool. It only ever grows; sprites past the current
+        # pickup count are hidden instead of being removed from the list.
+        self.pickup_sprite_list = pixelated_sprite_list()
         self.pickup_sprite_list.initialize()
         self.pickup_sprite_list.preload_textures(self.pickup_textures.values())
         self.pickup_sprites = []
 
         for pickup in state.pickups:
             sprite = PickupSprite(
-                pickup_textures=self.pickup_textures,
+                pickup_textures=self.pickup_texture_table,
                 transparent_texture=transparent_texture,
                 zoom=zoom,
                 screen_height=screen_height,
@@ -160,57 +187,64 @@ class EntityRenderer:
             self.pickup_sprites.append(sprite)
 
         self.pickup_sprite_list.extend(self.pickup_sprites)
+        self._active_pickup_count = len(self.pickup_sprites)
 
-        # Bomb sprite list (dynamic length)
-        self.bomb_sprite_list = arcade.SpriteList()
+        # Bomb sprite pool, grow-only like the pickup pool
+        self.bomb_sprite_list = pixelated_sprite_list()
         self.bomb_sprite_list.initialize()
         self.bomb_sprite_list.preload_textures(self.bomb_textures.values())
         self.bomb_sprites = []
 
+        current_time = Clock.now()
         for bomb in state.bombs:
             sprite = BombSprite(
-                bomb_textures=self.bomb_textures,
+                bomb_textures=self.bomb_texture_table,
                 transparent_texture=transparent_texture,
                 zoom=zoom,
                 screen_height=screen_height,
                 map_height=map_height,
             )
-            sprite.update_from_bomb(bomb)
+            sprite.update_from_bomb(bomb, current_time)
             self.bomb_sprites.append(sprite)
 
         self.bomb_sprite_list.extend(self.bomb_sprites)
+        self._active_bomb_count = len(self.bomb_sprites)
 
         # Explosion sprite list - one per map tile at world positions
-        self.explosion_sprite_list = arcade.SpriteList()
+        # Explosions share the tilemap atlas when one is provided so the
+        # whole grid layer stays within a single texture binding.
+        self.explosion_sprite_list = pixelated_sprite_list(atlas=tile_atlas)
         self.explosion_sprite_list.initialize()
-        self.explosion_sprite_list.preload_textures(self.explosion_frame_textures)
+        if tile_atlas is not None:
+            for texture in self.explosion_frame_textures:
+                tile_atlas.add(texture)
+        else:
+            self.explosion_sprite_list.preload_textures(self.explosion_frame_textures)
         self.explosion_sprites = []
 
-        for y in range(state.height):
-            world_y = (
-                state.height - 1 - y
-            ) * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-            for x in range(state.width):
-                world_x = x * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-                sprite = ExplosionSprite(
-                    explosion_textures=self.explosion_frame_textures,
-                    transparent_texture=transparent_texture,
-                    zoom=zoom,
-                    screen_height=screen_height,
-                )
-                sprite.center_x = world_x
-                sprite.center_y = world_y
-                sprite.scale = zoom
-                sprite.texture = transparent_texture
-                self.explosion_sprites.append(sprite)
-                self.explosion_sprite_list.append(sprite)
+        for world_x, world_y in zip(
+            *grid_center_positions(state.width, state.height, zoom)
+        ):
+            sprite = ExplosionSprite(
+                explosion_textures=self.explosion_frame_textures,
+                transparent_texture=transparent_texture,
+                zoom=zoom,
+                screen_height=screen_height,
+            )
+            sprite.position = (world_x, world_y)
+            sprite.scale = zoom
+            sprite.texture = transparent_texture
+            self.explosion_sprites.append(sprite)
+        self.explosion_sprite_list.extend(self.explosion_sprites)
+        # Indices of explosion sprites whose animation has not finished yet
+        self._active_explosions: set[int] = set()
 
         # Blood/splatter sprite list. Holds the sprites of dead players and
         # dead monsters so they can be drawn early (just above the tilemap)
         # instead of on top of everything else like live entities. Each
         # sprite belongs to exactly one list at a time — its main list
         # (player/monster) while alive, this list once dead.
-        self.blood_sprite_list = arcade.SpriteList()
+        self.blood_sprite_list = pixelated_sprite_list()
         self.blood_sprite_list.initialize()
         self.blood_sprite_list.preload_textures(
             [self.blood_texture, self.blood_green_texture]
@@ -226,40 +260,43 @@ class EntityRenderer:
         self.blood_sprite_list.remove(sprite)
         alive_list.append(sprite)
 
-    def on_draw(self, splatter: bool, pixelated: bool = True) -> None:
+    def on_draw(self, splatter: bool) -> None:
         """Draw the entity sprite lists in one of two passes.
 
         splatter=True:  blood sprites only (dead players, dead monsters).
                         Game renderer calls this just above the tilemap.
         splatter=False: pickups, bombs, alive monsters, alive players,
                         explosions — drawn on top of everything else.
+
+        All entity lists default to nearest filtering, so no per-draw filter
+        argument is needed.
         """
         if splatter:
-            self.blood_sprite_list.draw(pixelated=pixelated)  # type: ignore
+            self.blood_sprite_list.draw()
             return
-        self.pickup_sprite_list.draw(pixelated=pixelated)  # type: ignore
-        self.bomb_sprite_list.draw(pixelated=pixelated)  # type: ignore
-        self.monster_sprite_list.draw(pixelated=pixelated)  # type: ignore
-        self.player_sprite_list.draw(pixelated=pixelated)  # type: ignore
-        self.explosion_sprite_list.draw(pixelated=pixelated)  # type: ignore
+        self.pickup_sprite_list.draw()
+        self.bomb_sprite_list.draw()
+        self.monster_sprite_list.draw()
+        self.player_sprite_list.draw()
+        self.explosion_sprite_list.draw()
 
     def on_update(
         self,
         state: RenderState,
         current_time: float,
         delta_time: float,
-        view_start_x: int,
-        view_end_x: int,
-        view_start_y: int,
-        view_end_y: int,
+        view: "ViewBounds",
     ):
         """Update entity sprites."""
-        # Update pickups (dynamic list)
+        view_start_x, view_end_x = view.x0, view.x1
+        view_start_y, view_end_y = view.y0, view.y1
+
+        # Update pickups (grow-only pool)
         pickup_count = len(state.pickups)
 
         while len(self.pickup_sprites) < pickup_count:
             sprite = PickupSprite(
-                pickup_textures=self.pickup_textures,
+                pickup_textures=self.pickup_texture_table,
                 transparent_texture=self.transparent_texture,
                 zoom=self.zoom,
                 screen_height=self.screen_height,
@@ -268,19 +305,19 @@ class EntityRenderer:
             self.pickup_sprites.append(sprite)
             self.pickup_sprite_list.append(sprite)
 
-        while len(self.pickup_sprites) > pickup_count:
-            sprite = self.pickup_sprites.pop()
-            self.pickup_sprite_list.remove(sprite)
+        for i in range(pickup_count, self._active_pickup_count):
+            self.pickup_sprites[i].hide()
+        self._active_pickup_count = pickup_count
 
         for i, pickup in enumerate(state.pickups):
             self.pickup_sprites[i].update_from_pickup(pickup)
 
-        # Update bombs (dynamic list)
+        # Update bombs (grow-only pool)
         bomb_count = len(state.bombs)
 
         while len(self.bomb_sprites) < bomb_count:
             sprite = BombSprite(
-                bomb_textures=self.bomb_textures,
+                bomb_textures=self.bomb_texture_table,
                 transparent_texture=self.transparent_texture,
                 zoom=self.zoom,
                 screen_height=self.screen_height,
@@ -289,21 +326,34 @@ class EntityRenderer:
             self.bomb_sprites.append(sprite)
             self.bomb_sprite_list.append(sprite)
 
-        while len(self.bomb_sprites) > bomb_count:
-            sprite = self.bomb_sprites.pop()
-            self.bomb_sprite_list.remove(sprite)
+        for i in range(bomb_count, self._active_bomb_count):
+            self.bomb_sprites[i].hide()
+        self._active_bomb_count = bomb_count
 
         for i, bomb in enumerate(state.bombs):
             self.bomb_sprites[i].update_from_bomb(bomb, current_time)
 
-        # Update visible explosions
-        for y in range(view_start_y, view_end_y):
-            for x in range(view_start_x, view_end_x):
-                sprite_idx = y * state.width + x
-                explosion_type = state.explosions[y, x]
-                self.explosion_sprites[sprite_idx].update_from_type(
-                    explosion_type, current_time
-                )
+        # Update visible explosions. Only cells with a new explosion or an
+        # animation still in progress need work; every other sprite is
+        # already showing the transparent texture.
+        explosion_sprites = self.explosion_sprites
+        active_explosions = self._active_explosions
+        width = state.width
+        rows, cols = np.nonzero(
+            state.explosions[view_start_y:view_end_y, view_start_x:view_end_x]
+        )
+        active_explosions.update(
+            ((rows + view_start_y) * width + (cols + view_start_x)).tolist()
+        )
+        explosions = state.explosions
+        for sprite_idx in list(active_explosions):
+            y, x = divmod(sprite_idx, width)
+            if not (view_start_y <= y < view_end_y and view_start_x <= x < view_end_x):
+                continue
+            sprite = explosion_sprites[sprite_idx]
+            sprite.update_from_type(explosions[y, x], current_time)
+            if sprite.texture is self.transparent_texture:
+                active_explosions.discard(sprite_idx)
 
         # Update monsters (dynamic list)
         monster_count = len(state.monsters)
@@ -311,7 +361,7 @@ class EntityRenderer:
         while len(self.monster_sprites) < monster_count:
             sprite = MonsterSprite(
                 entity_type=EntityType.SLIME,
-                monster_textures=self.monster_textures,
+                monster_textures=self.monster_texture_table,
                 transparent_texture=self.transparent_texture,
                 blood_green_texture=self.blood_green_texture,
                 zoom=self.zoom,
@@ -352,32 +402,37 @@ class EntityRenderer:
                 self._move_to_alive(self.player_sprites[i], self.player_sprite_list)
                 self._player_in_blood[i] = False
 
+    def _load_cached(self, sprite_name: str) -> arcade.Texture:
+        """Load a sprite texture by name, reusing it if already loaded."""
+        texture = self._texture_cache.get(sprite_name)
+        if texture is None:
+            path = os.path.join(self.sprites_path, f"{sprite_name}.png")
+            texture = arcade.load_texture(path)
+            self._texture_cache[sprite_name] = texture
+        return texture
+
     def _load_bomb_textures(self):
         """Load all bomb textures into self.bomb_textures dict."""
 
-        # Helper to load animated bomb with 3 frames
-        def load_animated(bomb_type, base_name, has_defused=True):
-            for frame in range(1, 4):
-                path = os.path.join(self.sprites_path, f"{base_name}{frame}.png")
-                self.bomb_textures[(bomb_type, "active", frame)] = arcade.load_texture(
-                    path
+        # Helper to load animated bomb (3 frames unless stated otherwise)
+        def load_animated(bomb_type, base_name, has_defused=True, frame_count=3):
+            for frame in range(1, frame_count + 1):
+                self.bomb_textures[(bomb_type, "active", frame)] = self._load_cached(
+                    f"{base_name}{frame}"
                 )
             if has_defused:
-                path = os.path.join(self.sprites_path, f"{base_name}_defused.png")
-                self.bomb_textures[(bomb_type, "defused", 0)] = arcade.load_texture(
-                    path
+                self.bomb_textures[(bomb_type, "defused", 0)] = self._load_cached(
+                    f"{base_name}_defused"
                 )
 
         # Helper to load single-frame bomb (same texture for all frames)
         def load_static(bomb_type, sprite_name, defused_name=None):
-            path = os.path.join(self.sprites_path, f"{sprite_name}.png")
-            texture = arcade.load_texture(path)
+            texture = self._load_cached(sprite_name)
             for frame in range(1, 4):
                 self.bomb_textures[(bomb_type, "active", frame)] = texture
             if defused_name:
-                defused_path = os.path.join(self.sprites_path, f"{defused_name}.png")
-                self.bomb_textures[(bomb_type, "defused", 0)] = arcade.load_texture(
-                    defused_path
+                self.bomb_textures[(bomb_type, "defused", 0)] = self._load_cached(
+                    defused_name
                 )
             else:
                 self.bomb_textures[(bomb_type, "defused", 0)] = texture
@@ -397,17 +452,8 @@ class EntityRenderer:
         load_static(BombType.GRASSHOPPER, "grasshopper")
         load_static(BombType.SMALL_REMOTE, "smallremote_player1")
         load_static(BombType.BIG_REMOTE, "bigremote_player1")
-        # Flame barrel has 2-frame animation like nuke
-        for frame in [1, 2]:
-            path = os.path.join(self.sprites_path, f"smallbarrel{frame}.png")
-            self.bomb_textures[(BombType.FLAME_BARREL, "active", frame)] = (
-                arcade.load_texture(path)
-            )
-        # Defused state
-        defused_path = os.path.join(self.sprites_path, "smallbarrel_defused.png")
-        self.bomb_textures[(BombType.FLAME_BARREL, "defused", 0)] = arcade.load_texture(
-            defused_path
-        )
+        # Flame barrel has a 2-frame animation plus a defused state
+        load_animated(BombType.FLAME_BARREL, "smallbarrel", frame_count=2)
 
         # Cracker barrel (static, no defused state since it's triggered by damage)
         load_static(BombType.CRACKER_BARREL, "crackerbarrel")
@@ -415,11 +461,5 @@ class EntityRenderer:
         # Digger bomb (static)
         load_static(BombType.DIGGER_BOMB, "diggerbomb")
 
-        # GRASSHOPPER_HOP uses same texture as GRASSHOPPER
-        for frame in range(1, 4):
-            self.bomb_textures[(BombType.GRASSHOPPER_HOP, "active", frame)] = (
-                self.bomb_textures[(BombType.GRASSHOPPER, "active", frame)]
-            )
-        self.bomb_textures[(BombType.GRASSHOPPER_HOP, "defused", 0)] = (
-            self.bomb_textures[(BombType.GRASSHOPPER, "defused", 0)]
-        )
+        # GRASSHOPPER_HOP uses same texture as GRASSHOPPER (cached, not reloaded)
+        load_static(BombType.GRASSHOPPER_HOP, "grasshopper")
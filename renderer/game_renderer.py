@@ -31,6 +31,9 @@ SPRITES_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "sprites"
 
 TARGET_FPS = 60
 VSYNC = True
+# Longest frame step passed on to the sub-renderers, so animations don't try
+# to catch up on everything that elapsed while the window was minimised
+MAX_DELTA_TIME = 0.25
 
 SPRITE_SIZE = 10
 UI_TOP_MARGIN = 30  # Pixels of free space at top for UI (before zoom)
@@ -39,6 +42,9 @@ UI_TOP_MARGIN = 30  # Pixels of free space at top for UI (before zoom)
 VIEWPORT_WIDTH = 64  # Visible tiles horizontally
 VIEWPORT_HEIGHT = 45  # Visible tiles vertically
 
+# Toggles the performance graphs on and off when stats are enabled
+STATS_TOGGLE_KEY = arcade.key.F3
+
 # Big overlay text (countdown / round end). Bitmap font is 8x8 base,
 # zoom 12 matches the visual weight of the previous arcade font_size=100.
 COOL_TEXT_ZOOM = 12
@@ -49,6 +55,25 @@ COOL_TEXT_ZOOM = 12
 # ============================================================================
 
 
+class ViewBounds:
+    """Visible tile range and camera position, shared with sub-renderers.
+
+    A single instance is owned by GameView and mutated in place every frame.
+    Tile ranges are half-open: columns x0..x1-1, rows y0..y1-1.
+    """
+
+    __slots__ = ("x0", "x1", "y0", "y1", "cam_x", "cam_y", "tile_px")
+
+    def __init__(self):
+        self.x0 = 0
+        self.x1 = 0
+        self.y0 = 0
+        self.y1 = 0
+        self.cam_x = 0.0
+        self.cam_y = 0.0
+        self.tile_px = 0
+
+
 class GameView(arcade.View):
     """Main game view and renderer"""
 
@@ -70,12 +95,11 @@ class GameView(arcade.View):
         super().__init__()
         self.client_player_name = client_player_name
         self.item_hotkeys = item_hotkeys or {}
-        self.show_stats = show_stats
         self.render_state_function = render_state_function
         self.show_stats = show_stats
+        self.stats_visible = show_stats
         self.show_grid = show_grid
         self.input_callback: Optional[Callable[[int, int], None]] = None
-        self.input_callback_bound = False
         self.start_time = Clock.now()
         self.closing = False
         self.elapsed_since_closing = 0.0
@@ -120,6 +144,7 @@ class GameView(arcade.View):
             self.window.height,
             self.map_height,
             SPRITES_PATH,
+            tile_atlas=self.tile_renderer.atlas,
         )
         self.header_renderer = HeaderRenderer(
             self.transparent_texture,
@@ -127,6 +152,7 @@ class GameView(arcade.View):
             self.window.height,
             self.show_stats,
             self.item_hotkeys,
+            self.client_player_name,
         )
         self.margin_renderer = MarginRenderer(
             self.zoom, self.window.height, self.client_player_name
@@ -141,6 +167,16 @@ class GameView(arcade.View):
         # positioned at bottom-left of window
         self.viewport_pixels_x = VIEWPORT_WIDTH * SPRITE_SIZE * self.zoom
         self.viewport_pixels_y = VIEWPORT_HEIGHT * SPRITE_SIZE * self.zoom
+
+        # Per-frame camera/culling constants (invariant after initialize).
+        # Zoom and sprite size are integers, so these stay exact ints and the
+        # tile-range math can use floor division.
+        self.tile_size_px = SPRITE_SIZE * self.zoom
+        self.half_view_x = self.viewport_pixels_x // 2
+        self.half_view_y = self.viewport_pixels_y // 2
+        self.map_pixels_y = self.map_height * self.tile_size_px
+        self._view = ViewBounds()
+        self._view.tile_px = self.tile_size_px
         self.game_camera = arcade.Camera2D(
             viewport=arcade.LBWH(
                 0, 0, int(self.viewport_pixels_x), int(self.viewport_pixels_y)
@@ -202,6 +238,12 @@ class GameView(arcade.View):
                 if self.elapsed_since_closing > self.CLOSE_TIMEOUT:
                     self.window.view_complete()
 
+        # Nothing is visible while minimised: keep only the explosion history
+        # current (it is not recoverable later) and skip the rest
+        if self.window.minimized or not (self.window.width and self.window.height):
+            self.tile_renderer.on_update(state)
+            return
+
         current_time = time.perf_counter()  # Single timestamp for all updates
 
         # Calculate camera position based on client player
@@ -224,9 +266,9 @@ class GameView(arcade.View):
         self.game_camera.position = (cam_x, cam_y)
 
         # Calculate visible tile range using viewport dimensions (64x45 tiles)
-        tile_size_px = SPRITE_SIZE * self.zoom
-        half_view_x = self.viewport_pixels_x / 2
-        half_view_y = self.viewport_pixels_y / 2
+        tile_size_px = self.tile_size_px
+        half_view_x = self.half_view_x
+        half_view_y = self.half_view_y
 
         # Calculate view bounds in world pixels
         view_left_px = cam_x - half_view_x
@@ -234,28 +276,31 @@ class GameView(arcade.View):
         view_bottom_world_y = cam_y - half_view_y
         view_top_world_y = cam_y + half_view_y
 
+        view = self._view
+        view.cam_x = cam_x
+        view.cam_y = cam_y
+
         # Convert to tile coordinates (game y=0 at top, world y=0 at bottom)
         # Add buffer of 1 tile on each side for partially visible tiles
-        view_start_x = max(0, int(view_left_px / tile_size_px) - 1)
-        view_end_x = min(state.width, int(view_right_px / tile_size_px) + 2)
+        # (clamped with conditionals rather than max()/min() calls)
+        x0 = int(view_left_px // tile_size_px) - 1
+        x1 = int(view_right_px // tile_size_px) + 2
+        view.x0 = x0 if x0 > 0 else 0
+        view.x1 = x1 if x1 < state.width else state.width
 
-        # World y to game y: game_y = map_height - (world_y / tile_size_px)
+        # World y to game y: game_y = (map_pixels_y - world_y) // tile_size_px
         # Top of view (high world y) = low game y (top rows)
         # Bottom of view (low world y) = high game y (bottom rows)
-        view_start_y = max(
-            0, int(self.map_height - view_top_world_y / tile_size_px) - 1
-        )
-        view_end_y = min(
-            state.height, int(self.map_height - view_bottom_world_y / tile_size_px) + 2
-        )
+        y0 = int((self.map_pixels_y - view_top_world_y) // tile_size_px) - 1
+        y1 = int((self.map_pixels_y - view_bottom_world_y) // tile_size_px) + 2
+        view.y0 = y0 if y0 > 0 else 0
+        view.y1 = y1 if y1 < state.height else state.height
 
         # Delegate to sub-renderers
-        self.tile_renderer.on_update(
-            state, view_start_x, view_end_x, view_start_y, view_end_y
-        )
+        self.tile_renderer.on_update(state)
         countdown_started_at = self.window.countdown_value_started_at
         time_in_value = (
-            time.perf_counter() - countdown_started_at
+            current_time - countdown_started_at
             if countdown_started_at is not None
             else 0.0
         )
@@ -265,16 +310,15 @@ class GameView(arcade.View):
             time_in_value,
             self.client_player_name,
         )
+        # Only the animations are clamped; the closing timer above keeps
+        # counting real elapsed time
         self.entity_renderer.on_update(
             state,
             current_time,
-            delta_time,
-            view_start_x,
-            view_end_x,
-            view_start_y,
-            view_end_y,
+            min(delta_time, MAX_DELTA_TIME),
+            view,
         )
-        self.header_renderer.on_update(state.players, self.client_player_name)
+        self.header_renderer.on_update(client_player)
         self.margin_renderer.on_update(state.players, state.round_time_left)
 
     # ██╗  ██╗███████╗██╗     ██████╗ ███████╗██████╗ ███████╗
@@ -313,12 +357,13 @@ class GameView(arcade.View):
             (cam_x, cam_y) in world pixel coordinates
         """
         # Use viewport dimensions (64x45 tiles), not window dimensions
-        viewport_pixels_x = VIEWPORT_WIDTH * SPRITE_SIZE * self.zoom
-        viewport_pixels_y = VIEWPORT_HEIGHT * SPRITE_SIZE * self.zoom
-        half_view_x = viewport_pixels_x / 2
-        half_view_y = viewport_pixels_y / 2
-        map_pixels_x = map_width * SPRITE_SIZE * self.zoom
-        map_pixels_y = map_height * SPRITE_SIZE * self.zoom
+        viewport_pixels_x = self.viewport_pixels_x
+        viewport_pixels_y = self.viewport_pixels_y
+        half_view_x = self.half_view_x
+        half_view_y = self.half_view_y
+        tile_size_px = self.tile_size_px
+        map_pixels_x = map_width * tile_size_px
+        map_pixels_y = map_height * tile_size_px
 
         # Small maps: position so map is at top-left of viewport
         if map_pixels_x <= viewport_pixels_x and map_pixels_y <= viewport_pixels_y:
@@ -329,8 +374,8 @@ class GameView(arcade.View):
         # Large maps: center on player (in world pixel coords)
         # Player position in world pixels
         # (Y inverted: row 0 at top in game coords, at bottom in world)
-        player_world_x = player_x * SPRITE_SIZE * self.zoom
-        player_world_y = (map_height - player_y) * SPRITE_SIZE * self.zoom
+        player_world_x = player_x * tile_size_px
+        player_world_y = (map_height - player_y) * tile_size_px
 
         cam_x = player_world_x
         cam_y = player_world_y
@@ -367,10 +412,8 @@ class GameView(arcade.View):
         cam_x, cam_y = self._cam_position
         self.game_camera.position = (cam_x + shake_x, cam_y + shake_y)
         self.game_camera.use()
-        self.tile_renderer.background_tile_sprite_list.draw(pixelated=True)  # type: ignore
-        self.tile_renderer.vertical_transition_sprite_list.draw(pixelated=True)  # type: ignore
-        self.tile_renderer.horizontal_transition_sprite_list.draw(pixelated=True)  # type: ignore
-        self.tile_renderer.grid_sprite_list.draw(pixelated=True)  # type: ignore
+        self.tile_renderer.tilemap_sprite_list.draw()
+        self.tile_renderer.grid_sprite_list.draw()
         # Dead-entity sprites (blood/splatter) sit on top of the tilemap but
         # below pickups/bombs/live entities so corpses don't occlude active
         # gameplay elements.
@@ -379,7 +422,7 @@ class GameView(arcade.View):
         # Countdown reveal overlay: solid-colour blocks over the map during
         # the round-start countdown, fading to transparent radially in the
         # final second. Drawn last in game-camera space so it covers entities.
-        self.tile_renderer.overlay_sprite_list.draw(pixelated=True)  # type: ignore
+        self.tile_renderer.overlay_sprite_list.draw()
 
         # Draw white flash overlay (in game camera space, fades over 1 second)
         if elapsed < self.NUKE_FLASH_DURATION:
@@ -396,11 +439,11 @@ class GameView(arcade.View):
         center_y = self.window.height / 2
         self.ui_camera.position = (center_x + shake_x, center_y + shake_y)
         self.ui_camera.use()
-        self.header_renderer.on_draw(show_stats=not shaking and self.show_stats)
+        self.header_renderer.on_draw(show_stats=not shaking and self.stats_visible)
         self.margin_renderer.on_draw()
 
         # Draw perf graphs without shake (stationary)
-        if shaking and self.show_stats:
+        if shaking and self.stats_visible:
             self.ui_camera.position = (center_x, center_y)
             self.ui_camera.use()
             self.header_renderer.draw_perf_graphs()
@@ -414,7 +457,6 @@ class GameView(arcade.View):
             self.draw_end()
 
     def draw_countdown(self):
-        state = self.render_state_function()
         countdown = self.window.countdown
         text = str(int(countdown))
 
@@ -469,9 +511,12 @@ class GameView(arcade.View):
 
     def bind_input_callback(self, callback: Callable[[int, int], None]) -> None:
         self.input_callback = callback
-        self.input_callback_bound = True
 
     def on_key_press(self, symbol: int, modifiers: int):
+        if symbol == STATS_TOGGLE_KEY and self.show_stats:
+            self.stats_visible = not self.stats_visible
+            self.header_renderer.set_perf_graphs_visible(self.stats_visible)
+            return
         if self.input_callback is not None:
             self.input_callback(symbol, modifiers)
 
@@ -9,8 +9,10 @@ import arcade
 from PIL import Image
 from typing import Dict, List, Optional
 from common.bomb_dictionary import BombType, BOMB_TYPE_TO_ICON
+from common.inventory_hatch import create_inventory_hatch_image
 from renderer.bitmap_text import BitmapText
 from renderer.player_colorizer import PlayerColorizer
+from renderer.tile_renderer import pixelated_sprite_list
 from game_engine.entities.player import Player
 
 
@@ -21,13 +23,44 @@ GRAPH_WIDTH = 200
 GRAPH_HEIGHT = 120
 GRAPH_MARGIN = 5
 
+# Atlas for the header UI textures: 256 8x8 font glyphs plus the card,
+# icons, hatch and separator fit comfortably; it grows if ever needed
+UI_ATLAS_SIZE = (512, 512)
+UI_ATLAS_BORDER = 1
+
+# Inventory slot geometry in unzoomed pixels
+INVENTORY_ICON_SIZE = 30
+INVENTORY_SEPARATOR_WIDTH = 3
+
+
+class _LazyTextureDict:
+    """Read-only mapping of key -> texture that loads each file on first access."""
+
+    def __init__(self, paths: Dict):
+        self._paths = paths
+        self._textures: Dict = {}
+
+    def __getitem__(self, key) -> arcade.Texture:
+        texture = self._textures.get(key)
+        if texture is None:
+            texture = arcade.load_texture(self._paths[key])
+            self._textures[key] = texture
+        return texture
+
+    def get(self, key, default=None) -> Optional[arcade.Texture]:
+        if key not in self._paths:
+            return default
+        return self[key]
+
 
 class HeaderRenderer:
     """Handles header UI rendering: player card, inventory, stats, perf graphs."""
 
     def __init__(self, transparent_texture, zoom, screen_height, show_stats,
-                 item_hotkeys: Optional[Dict[BombType, str]] = None):
+                 item_hotkeys: Optional[Dict[BombType, str]] = None,
+                 client_player_name: str = ""):
         self.zoom = zoom
+        self.client_player_name = client_player_name
         self.transparent_texture = transparent_texture
         self.screen_height = screen_height
         self.item_hotkeys = item_hotkeys or {}
@@ -37,33 +70,28 @@ class HeaderRenderer:
         self.cached_card_texture: Optional[arcade.Texture] = None
         self.cached_card_key: Optional[tuple] = None  # (sprite_id, color)
 
-        # Load inventory icon textures: BombType -> texture
-        self.inventory_icon_textures = {}
-        for bomb_type, icon_name in BOMB_TYPE_TO_ICON.items():
-            path = os.path.join(SPRITES_PATH, f"{icon_name}_icon.png")
-            self.inventory_icon_textures[bomb_type] = arcade.load_texture(path)
+        # Inventory icon textures: BombType -> texture, loaded on first use
+        # since a player only ever holds a few of the bomb types
+        self.inventory_icon_textures = _LazyTextureDict({
+            bomb_type: os.path.join(SPRITES_PATH, f"{icon_name}_icon.png")
+            for bomb_type, icon_name in BOMB_TYPE_TO_ICON.items()
+        })
 
         # Load icon separator texture
         self.icon_separator_texture = arcade.load_texture(
             os.path.join(SPRITES_PATH, "icon_separator.png")
         )
 
-        # Create cross-hatch texture for non-selected inventory items (30x30)
-        hatch_size = 30
-        hatch_image = Image.new('RGBA', (hatch_size, hatch_size), (0, 0, 0, 0))
-        hatch_pixels = hatch_image.load()
-        assert hatch_pixels is not None
-        hatch_color = (103, 103, 103, 255)  # Grey #676767
-        # Draw diagonal hatch pattern - pixel every 4th on diagonals
-        for y in range(hatch_size):
-            for x in range(hatch_size):
-                if (x + y) % 4 == 0:
-                    hatch_pixels[x, y] = hatch_color
-        self.hatch_texture = arcade.Texture(hatch_image, name="inventory_hatch")
-
-        # Header UI sprite list
-        self.header_sprite_list = arcade.SpriteList()
-        self.header_sprite_list.initialize()
+        # Cross-hatch texture for non-selected inventory items (30x30), written
+        # by asset_extractor; built here for asset folders extracted before it
+        try:
+            self.hatch_texture = arcade.load_texture(
+                os.path.join(SPRITES_PATH, "inventory_hatch.png")
+            )
+        except FileNotFoundError:
+            self.hatch_texture = arcade.Texture(
+                create_inventory_hatch_image(), name="inventory_hatch"
+            )
 
         # Player card sprite (110x30 pixels, positioned at top-left corner)
         self.player_card_sprite = arcade.Sprite()
@@ -74,38 +102,59 @@ class HeaderRenderer:
         card_height = 30
         self.player_card_sprite.center_x = (card_width / 2) * zoom
         self.player_card_sprite.center_y = screen_height - (card_height / 2) * zoom
-        self.header_sprite_list.append(self.player_card_sprite)
 
         # Damage overlay (black rectangle over health bar on player card)
-        self.damage_overlay_sprites = arcade.SpriteList()
         black_image = Image.new('RGBA', (1, 1), (0, 0, 0, 255))
         self.damage_overlay = arcade.Sprite()
         self.damage_overlay.texture = arcade.Texture(black_image, name="damage_overlay")
         self.damage_overlay.visible = False
-        self.damage_overlay_sprites.append(self.damage_overlay)
         self.current_health = None
 
         # Bitmap text for header
         font_path = os.path.join(SPRITES_PATH, "font.png")
         self.bitmap_text = BitmapText(font_path, zoom=zoom)
 
-        # Player name text sprite list (updated in on_update)
-        self.player_name_sprites = arcade.SpriteList()
-        self.current_player_name = None  # Use None so first comparison triggers text creation
-
-        # Fight power and money text sprite lists
-        self.dig_power_sprites = arcade.SpriteList()
-        self.money_sprites = arcade.SpriteList()
+        # Single header UI sprite list holding every element in z-order
+        # (card, damage overlay, texts, inventory); refilled from the
+        # per-element sprite groups below whenever one of them changes.
+        # It has its own atlas with the fixed UI textures and font glyphs
+        # added up front, so the header never grows the shared atlas mid-game.
+        self.ui_atlas = arcade.DefaultTextureAtlas(UI_ATLAS_SIZE, border=UI_ATLAS_BORDER)
+        for texture in (
+            transparent_texture,
+            self.hatch_texture,
+            self.icon_separator_texture,
+            self.damage_overlay.texture,
+            *self.bitmap_text.char_textures.values(),
+        ):
+            self.ui_atlas.add(texture)
+        self.ui_sprite_list = pixelated_sprite_list(atlas=self.ui_atlas)
+        self.ui_sprite_list.initialize()
+        self._ui_dirty = True
+
+        # Player name text sprites (updated in on_update)
+        self.player_name_sprites: List[arcade.Sprite] = []
+        # Sentinel (not None/"") so the first comparison always triggers text creation
+        self.current_player_name = object()
+
+        # Fight power and money text sprites, rewritten in place on change
+        self.dig_power_sprites: List[arcade.Sprite] = []
+        self.money_sprites: List[arcade.Sprite] = []
         self.current_dig_power = None
         self.current_money = None
 
-        # Inventory icons sprite list (updated in on_update)
-        self.inventory_sprites = arcade.SpriteList()
-        self.inventory_count_sprites = arcade.SpriteList()  # Text for item counts
-        self.inventory_hatch_sprites = arcade.SpriteList()  # Hatch overlay for non-selected
-        self.current_inventory = None  # Track inventory to detect changes
+        # Inventory icon sprites (updated in on_update)
+        self.inventory_sprites: List[arcade.Sprite] = []
+        self.inventory_count_sprites: List[arcade.Sprite] = []  # Text for item counts
+        self.inventory_hatch_sprites: List[arcade.Sprite] = []  # Hatch overlay per slot
+        self.current_inventory = None  # Copy of the inventory last shown
         self.current_selected = None  # Track selected index to detect changes
-        self.hotkey_text_sprites = arcade.SpriteList()  # Hotkey labels on icons
+        self._slot_position_cache: List[tuple] = []  # See _slot_positions
+        self.hotkey_text_sprites: List[arcade.Sprite] = []  # Hotkey labels on icons
+
+        # Combined key of everything the client player contributes to the
+        # header; when unchanged the per-element comparisons are skipped
+        self._last_state_key: Optional[tuple] = None
 
         # Performance graph (only if show_stats is enabled)
         self.perf_graph_list = arcade.SpriteList()
@@ -133,13 +182,36 @@ class HeaderRenderer:
             graph.alpha = 128
             self.perf_graph_list.append(graph)
 
-    def on_update(self, players: List[Player], client_player_name: str):
+        # All graphs, including ones currently hidden from perf_graph_list
+        self.perf_graphs: List[arcade.PerfGraph] = list(self.perf_graph_list)
+
+    def set_perf_graphs_visible(self, visible: bool):
+        """Show or hide the performance graphs.
+
+        A PerfGraph skips its scheduled texture redraw while it is in no
+        sprite list, so hidden graphs cost nothing per frame.
+        """
+        if visible:
+            if len(self.perf_graph_list) == 0:
+                self.perf_graph_list.extend(self.perf_graphs)
+        else:
+            self.perf_graph_list.clear()
+
+    def on_update(self, client_player: Optional[Player]):
         """Update header UI elements based on the client player's state.
 
         Args:
-            players: List of player entities from render state
-            client_player_name: Name of the client's player to find
+            client_player: The client's player entity, or None if not found
         """
+        self._update_elements(client_player)
+        if self._ui_dirty:
+            self._ui_dirty = False
+            self._refill_ui_sprite_list()
+
+    def _update_elements(self, client_player: Optional[Player]):
+        """Update the per-element sprite groups, flagging the UI list dirty
+        when a group is replaced."""
+        client_player_name = self.client_player_name
         # Update player name text (only recreate sprites if name changed)
         if client_player_name != self.current_player_name:
             self.current_player_name = client_player_name
@@ -148,29 +220,39 @@ class HeaderRenderer:
             # Position: 8 pixels from left edge, 1 pixel down from top
             text_x = 8 * self.zoom
             text_y = self.screen_height - self.zoom
-            self.player_name_sprites = self.bitmap_text.create_text_sprites(
+            self.player_name_sprites = list(self.bitmap_text.create_text_sprites(
                 display_name, text_x, text_y
-            )
-
-        # Find the client's player by name
-        client_player = None
-        for player in players:
-            if player.name == client_player_name:
-                client_player = player
-                break
+            ))
+            self._ui_dirty = True
 
         if client_player is None:
             # No matching player found, hide the card
             self.player_card_sprite.texture = self.transparent_texture
+            self._last_state_key = None
             return
 
-        # Update the player card texture (recolored per player color)
         sprite_id = client_player.sprite_id
-        card_key = (sprite_id, client_player.color)
+        color = client_player.color
+        dig_power = client_player.get_dig_power()
+        money = client_player.money
+        health = client_player.health
+        inventory = getattr(client_player, 'inventory', [])
+        selected = getattr(client_player, 'selected', 0)
+        # Compare the list itself against the copy taken when it last changed:
+        # list equality checks the length first and allocates nothing, unlike
+        # building a tuple of the inventory every frame
+        inventory_changed = inventory != self.current_inventory
+        state_key = (sprite_id, color, dig_power, money, health, selected)
+        if not inventory_changed and state_key == self._last_state_key:
+            return
+        self._last_state_key = state_key
+
+        # Update the player card texture (recolored per player color)
+        card_key = (sprite_id, color)
         if card_key != self.cached_card_key:
             self.cached_card_key = card_key
             self.cached_card_texture = self.colorizer.create_recolored_card(
-                sprite_id, client_player.color
+                sprite_id, color
             )
         if self.cached_card_texture is not None:
             self.player_card_sprite.texture = self.cached_card_texture
@@ -178,29 +260,31 @@ class HeaderRenderer:
             self.player_card_sprite.texture = self.transparent_texture
 
         # Update dig_power text (only recreate if changed)
-        if client_player.get_dig_power() != self.current_dig_power:
-            self.dig_power = client_player.get_dig_power()
+        if dig_power != self.current_dig_power:
+            self.current_dig_power = dig_power
             # Position: 26 pixels from left, 11 pixels down (8+3)
             text_x = 26 * self.zoom
             text_y = self.screen_height - 11 * self.zoom
-            self.dig_power_sprites = self.bitmap_text.create_text_sprites(
-                f"{client_player.get_dig_power()}", text_x, text_y, color=(255, 0, 0, 255)
-            )
+            if self.bitmap_text.update_text_sprites(
+                self.dig_power_sprites, f"{dig_power}", text_x, text_y, color=(255, 0, 0, 255)
+            ):
+                self._ui_dirty = True
 
         # Update money text (only recreate if changed)
-        if client_player.money != self.current_money:
-            self.current_money = client_player.money
+        if money != self.current_money:
+            self.current_money = money
             # Position: 26 pixels from left, 21 pixels down (11+11-1)
             text_x = 26 * self.zoom
             text_y = self.screen_height - 21 * self.zoom
-            self.money_sprites = self.bitmap_text.create_text_sprites(
-                f"{client_player.money}", text_x, text_y, color=(255, 255, 0, 255)
-            )
+            if self.bitmap_text.update_text_sprites(
+                self.money_sprites, f"{money}", text_x, text_y, color=(255, 255, 0, 255)
+            ):
+                self._ui_dirty = True
 
         # Update damage overlay on health bar (right edge of card)
-        if client_player.health != self.current_health:
-            self.current_health = client_player.health
-            damage_ratio = (100 - client_player.health) / 100
+        if health != self.current_health:
+            self.current_health = health
+            damage_ratio = (100 - health) / 100
             if damage_ratio > 0:
                 overlay_height = 26 * damage_ratio
                 self.damage_overlay.width = 8 * self.zoom
@@ -213,95 +297,132 @@ class HeaderRenderer:
 
         # Update inventory icons (only recreate if changed)
         # inventory is List[Tuple[BombType, int]]
-        inventory = getattr(client_player, 'inventory', [])
-        selected = getattr(client_player, 'selected', 0)
-        # Convert to tuple for comparison (includes counts and selection)
-        inventory_key = (tuple(inventory), selected)
-        if inventory_key != self.current_inventory:
-            self.current_inventory = inventory_key
-            # Clear existing sprites
-            self.inventory_sprites = arcade.SpriteList()
-            self.inventory_count_sprites = arcade.SpriteList()
-            self.inventory_hatch_sprites = arcade.SpriteList()
-            self.hotkey_text_sprites = arcade.SpriteList()
-
-            # Start position: just past the player card (110 pixels from left)
-            icon_x = 110 * self.zoom
-            icon_size = 30  # Icon size in pixels
-            separator_width = 3  # Separator width in pixels
-
-            for i, (bomb_type, count) in enumerate(inventory):
-                # Track icon left edge for count text positioning
+        if inventory_changed:
+            self.current_inventory = list(inventory)
+            self._rebuild_inventory(inventory, selected)
+            self._ui_dirty = True
+            self.current_selected = selected
+        elif selected != self.current_selected:
+            # Only the selection moved: toggle the two affected hatches
+            self._set_hatch_visible(self.current_selected, True)
+            self._set_hatch_visible(selected, False)
+            self.current_selected = selected
+
+    def _refill_ui_sprite_list(self):
+        """Refill the merged UI sprite list from the element groups in z-order."""
+        self.ui_sprite_list.clear()
+        self.ui_sprite_list.extend(
+            [self.player_card_sprite, self.damage_overlay]
+            + self.player_name_sprites
+            + self.dig_power_sprites
+            + self.money_sprites
+            + self.inventory_sprites
+            + self.inventory_hatch_sprites
+            + self.inventory_count_sprites
+            + self.hotkey_text_sprites
+        )
+
+    def _set_hatch_visible(self, index: int, visible: bool):
+        """Show or hide the hatch overlay of one inventory slot."""
+        if index is not None and 0 <= index < len(self.inventory_hatch_sprites):
+            self.inventory_hatch_sprites[index].visible = visible
+
+    def _slot_positions(self, count: int) -> List[tuple]:
+        """X positions (icon left, icon centre, separator centre) of the
+        first ``count`` inventory slots, computed once and extended on demand.
+
+        Slot positions do not depend on the inventory length, so one growing
+        list serves every inventory.
+        """
+        positions = self._slot_position_cache
+        if len(positions) < count:
+            icon_size = INVENTORY_ICON_SIZE
+            separator_width = INVENTORY_SEPARATOR_WIDTH
+            if positions:
+                # Resume after the last cached slot and its separator
+                icon_x = positions[-1][2] + (separator_width / 2) * self.zoom
+            else:
+                # Start position: just past the player card (110 pixels from left)
+                icon_x = 110 * self.zoom
+            while len(positions) < count:
                 icon_left_x = icon_x
                 icon_center_x = icon_x + (icon_size / 2) * self.zoom
-                icon_center_y = self.screen_height - (icon_size / 2) * self.zoom
-
-                # Add icon sprite
-                icon_texture = self.inventory_icon_textures.get(bomb_type)
-                if icon_texture:
-                    icon_sprite = arcade.Sprite()
-                    icon_sprite.texture = icon_texture
-                    icon_sprite.scale = self.zoom
-                    icon_sprite.center_x = icon_center_x
-                    icon_sprite.center_y = icon_center_y
-                    self.inventory_sprites.append(icon_sprite)
-
-                # Add hatch overlay for non-selected items
-                if i != selected:
-                    hatch_sprite = arcade.Sprite()
-                    hatch_sprite.texture = self.hatch_texture
-                    hatch_sprite.scale = self.zoom
-                    hatch_sprite.center_x = icon_center_x
-                    hatch_sprite.center_y = icon_center_y
-                    self.inventory_hatch_sprites.append(hatch_sprite)
-
-                # Add count text at top-left corner of icon
-                count_text_sprites = self.bitmap_text.create_text_sprites(
-                    str(count),
-                    icon_left_x + 1 * self.zoom,  # 1 pixel from left edge
-                    self.screen_height - 1 * self.zoom,  # 1 pixel from top
-                )
-                for sprite in count_text_sprites:
-                    self.inventory_count_sprites.append(sprite)
-
-                # Add hotkey label at bottom-right of icon
-                hotkey_label = self.item_hotkeys.get(bomb_type, "")
-                if hotkey_label:
-                    char_width = self.bitmap_text.char_width
-                    text_width = char_width * len(hotkey_label)
-                    hotkey_x = icon_left_x + (icon_size * self.zoom) - text_width - 1 * self.zoom
-                    hotkey_y = self.screen_height - (icon_size - self.bitmap_text.char_height / self.zoom - 1) * self.zoom
-                    hotkey_sprites = self.bitmap_text.create_text_sprites(
-                        hotkey_label, hotkey_x, hotkey_y
-                    )
-                    for sprite in hotkey_sprites:
-                        self.hotkey_text_sprites.append(sprite)
-
                 # Move x position past the icon
                 icon_x += icon_size * self.zoom
+                separator_center_x = icon_x + (separator_width / 2) * self.zoom
+                # Move x position past the separator
+                icon_x += separator_width * self.zoom
+                positions.append((icon_left_x, icon_center_x, separator_center_x))
+        return positions
+
+    def _rebuild_inventory(self, inventory, selected: int):
+        """Rebuild the inventory sprite groups for a new inventory."""
+        self.inventory_sprites = []
+        self.inventory_count_sprites = []
+        self.inventory_hatch_sprites = []
+        self.hotkey_text_sprites = []
+
+        zoom = self.zoom
+        icon_size = INVENTORY_ICON_SIZE
+        icon_center_y = self.screen_height - (icon_size / 2) * zoom
+        count_text_y = self.screen_height - 1 * zoom  # 1 pixel from top
+        hotkey_y = self.screen_height - (icon_size - self.bitmap_text.char_height / zoom - 1) * zoom
+        positions = self._slot_positions(len(inventory))
+
+        for i, (bomb_type, count) in enumerate(inventory):
+            icon_left_x, icon_center_x, separator_center_x = positions[i]
+
+            # Add icon sprite
+            icon_texture = self.inventory_icon_textures.get(bomb_type)
+            if icon_texture:
+                icon_sprite = arcade.Sprite()
+                icon_sprite.texture = icon_texture
+                icon_sprite.scale = zoom
+                icon_sprite.center_x = icon_center_x
+                icon_sprite.center_y = icon_center_y
+                self.inventory_sprites.append(icon_sprite)
+
+            # Add hatch overlay for every slot, hidden on the selected one so
+            # a selection change only toggles visibility
+            hatch_sprite = arcade.Sprite()
+            hatch_sprite.texture = self.hatch_texture
+            hatch_sprite.scale = zoom
+            hatch_sprite.center_x = icon_center_x
+            hatch_sprite.center_y = icon_center_y
+            hatch_sprite.visible = i != selected
+            self.inventory_hatch_sprites.append(hatch_sprite)
+
+            # Add count text at top-left corner of icon
+            count_text_sprites = self.bitmap_text.create_text_sprites(
+                str(count),
+                icon_left_x + 1 * zoom,  # 1 pixel from left edge
+                count_text_y,
+            )
+            self.inventory_count_sprites.extend(count_text_sprites)
+
+            # Add hotkey label at bottom-right of icon
+            hotkey_label = self.item_hotkeys.get(bomb_type, "")
+            if hotkey_label:
+                char_width = self.bitmap_text.char_width
+                text_width = char_width * len(hotkey_label)
+                hotkey_x = icon_left_x + (icon_size * zoom) - text_width - 1 * zoom
+                hotkey_sprites = self.bitmap_text.create_text_sprites(
+                    hotkey_label, hotkey_x, hotkey_y
+                )
+                self.hotkey_text_sprites.extend(hotkey_sprites)
 
-                # Add separator sprite (except after the last icon)
-                if i < len(inventory) - 1:
-                    separator_sprite = arcade.Sprite()
-                    separator_sprite.texture = self.icon_separator_texture
-                    separator_sprite.scale = self.zoom
-                    separator_sprite.center_x = icon_x + (separator_width / 2) * self.zoom
-                    separator_sprite.center_y = self.screen_height - (icon_size / 2) * self.zoom
-                    self.inventory_sprites.append(separator_sprite)
-                    # Move x position past the separator
-                    icon_x += separator_width * self.zoom
+            # Add separator sprite (except after the last icon)
+            if i < len(inventory) - 1:
+                separator_sprite = arcade.Sprite()
+                separator_sprite.texture = self.icon_separator_texture
+                separator_sprite.scale = zoom
+                separator_sprite.center_x = separator_center_x
+                separator_sprite.center_y = icon_center_y
+                self.inventory_sprites.append(separator_sprite)
 
     def on_draw(self, show_stats: bool):
-        """Draw all header UI sprite lists."""
-        self.header_sprite_list.draw(pixelated=True)
-        self.damage_overlay_sprites.draw(pixelated=True)
-        self.player_name_sprites.draw(pixelated=True)
-        self.dig_power_sprites.draw(pixelated=True)
-        self.money_sprites.draw(pixelated=True)
-        self.inventory_sprites.draw(pixelated=True)
-        self.inventory_hatch_sprites.draw(pixelated=True)
-        self.inventory_count_sprites.draw(pixelated=True)
-        self.hotkey_text_sprites.draw(pixelated=True)
+        """Draw the header UI sprite list and, optionally, the perf graphs."""
+        self.ui_sprite_list.draw()
         if show_stats:
             self.perf_graph_list.draw()
 
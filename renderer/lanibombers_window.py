@@ -110,6 +110,8 @@ class LanibombersWindow(arcade.Window):
         self.log = get_logger()
         self.connection_state = ClientConnectionState.NONE
         self.chat_log = []
+        # Set while the window is minimised/unmapped so views can skip rendering work
+        self.minimized = False
 
         if self.auto:
             self._auto_running = True
@@ -415,6 +417,18 @@ class LanibombersWindow(arcade.Window):
                 player.set_selected(i)
                 break
 
+    # ------------------------------------------------------------------
+    # Window visibility
+    # ------------------------------------------------------------------
+
+    def on_hide(self) -> None:
+        """Window was minimised or hidden."""
+        self.minimized = True
+
+    def on_show(self) -> None:
+        """Window was restored or shown."""
+        self.minimized = False
+
     # ------------------------------------------------------------------
     # Input
     # ------------------------------------------------------------------
@@ -5,8 +5,9 @@ Handles color swapping for player sprites and cards.
 
 import os
 import arcade
+import numpy as np
 from PIL import Image
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from game_engine.entities import Direction
 
@@ -68,6 +69,31 @@ def darken(color: Tuple[int, int, int], factor: float = 0.35) -> Tuple[int, int,
     return tuple(max(0, int(c * (1 - factor))) for c in color)  # type: ignore
 
 
+def pack_rgba(r: int, g: int, b: int, a: int) -> np.uint32:
+    """Pack RGBA bytes into the uint32 that an RGBA uint8 pixel views as."""
+    return np.array([r, g, b, a], dtype=np.uint8).view(np.uint32)[0]
+
+
+# Selects the RGB bytes of a packed pixel (and, inverted, the alpha byte)
+PACKED_RGB_MASK = pack_rgba(0xFF, 0xFF, 0xFF, 0x00)
+PACKED_ALPHA_MASK = pack_rgba(0x00, 0x00, 0x00, 0xFF)
+
+
+def player_texture_name(key: Tuple, color_tag: str) -> str:
+    """Deterministic texture hash for the player sprite key recolored as color_tag.
+
+    Naming textures up front spares arcade from hashing every recolored image
+    and lets the atlas recognize a texture it has already uploaded.
+    """
+    sprite_id, state, direction, frame = key
+    return f"player{sprite_id}_{color_tag}_{state}_{direction.value}_{frame}"
+
+
+def color_tag(color: Tuple[int, int, int]) -> str:
+    """Hex tag of an RGB color for texture names."""
+    return "%02x%02x%02x" % tuple(color)
+
+
 class PlayerColorizer:
     """Handles color swapping for player sprites and cards.
 
@@ -87,13 +113,34 @@ class PlayerColorizer:
         self.player_images: Dict[Tuple, Image.Image] = {}  # (sprite_id, state, direction, frame) -> PIL Image
         self.player_card_images: Dict[int, Image.Image] = {}  # sprite_id -> PIL Image
 
+        # Palette-indexed copies of the images above: (index map, palette of
+        # RGBA pixels packed into uint32). Recoloring only edits the few palette rows and expands
+        # the index map with a single gather. Player sprites are stacked per
+        # sprite_id and image size, so one gather recolors every variant.
+        # Keys sharing one image (walk/idle) share one slice:
+        # sprite_id -> [([keys per slice], NxHxW index stack, palette), ...]
+        self.player_stacks: Dict[int, List[Tuple[List[List[Tuple]], np.ndarray, np.ndarray]]] = {}
+        self.player_card_indexed: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
         # Store current textures
         self.player_textures: Dict[Tuple, arcade.Texture] = {}
         self.player_card_textures: Dict[int, arcade.Texture] = {}
 
+        # Recolored textures by (sprite_id, RGB color), so returning to a
+        # previously picked color (or another player sharing it) is a lookup
+        self.recolor_cache: Dict[Tuple[int, Tuple[int, int, int]], Dict[Tuple, arcade.Texture]] = {}
+        self.card_recolor_cache: Dict[Tuple[int, Tuple[int, int, int]], arcade.Texture] = {}
+
         # Load all images
         self._load_images()
 
+        # Recoloring never touches alpha, so every recolored texture keeps the
+        # hit box of its base texture and arcade needn't rescan the pixels
+        self.player_hit_boxes = {key: texture.hit_box_points for key, texture in self.player_textures.items()}
+        self.player_card_hit_boxes = {
+            sprite_id: texture.hit_box_points for sprite_id, texture in self.player_card_textures.items()
+        }
+
     def _load_images(self):
         """Load all player sprite and card images."""
         # Load player sprites
@@ -107,8 +154,10 @@ class PlayerColorizer:
                         img = Image.open(path).convert('RGBA')
                         self.player_images[(sprite_id, "walk", direction, frame)] = img
                         self.player_images[(sprite_id, "idle", direction, frame)] = img
-                        self.player_textures[(sprite_id, "walk", direction, frame)] = arcade.Texture(img)
-                        self.player_textures[(sprite_id, "idle", direction, frame)] = arcade.Texture(img)
+                        texture = arcade.Texture(
+                            img, hash=player_texture_name((sprite_id, "walk", direction, frame), "base"))
+                        self.player_textures[(sprite_id, "walk", direction, frame)] = texture
+                        self.player_textures[(sprite_id, "idle", direction, frame)] = texture
 
                     # Digging sprites
                     dig_sprite_name = f"player{sprite_id}_dig_{direction.value}_{frame}"
@@ -116,7 +165,8 @@ class PlayerColorizer:
                     if os.path.exists(dig_path):
                         dig_img = Image.open(dig_path).convert('RGBA')
                         self.player_images[(sprite_id, "dig", direction, frame)] = dig_img
-                        self.player_textures[(sprite_id, "dig", direction, frame)] = arcade.Texture(dig_img)
+                        self.player_textures[(sprite_id, "dig", direction, frame)] = arcade.Texture(
+                            dig_img, hash=player_texture_name((sprite_id, "dig", direction, frame), "base"))
 
         # Load player card images
         for sprite_id in range(1, 5):
@@ -124,28 +174,105 @@ class PlayerColorizer:
             if os.path.exists(path):
                 img = Image.open(path).convert('RGBA')
                 self.player_card_images[sprite_id] = img
-                self.player_card_textures[sprite_id] = arcade.Texture(img)
+                self.player_card_indexed[sprite_id] = self._index_colors(np.asarray(img))
+                self.player_card_textures[sprite_id] = arcade.Texture(img, hash=f"player_card_{sprite_id}_base")
 
-    def _swap_color(self, image: Image.Image, old_color: Tuple[int, int, int],
-                    new_color: Tuple[int, int, int]) -> Image.Image:
-        """Swap a specific color in an image with a new color."""
-        return self._swap_colors(image, {old_color: new_color})
+        self._build_player_stacks()
 
-    def _swap_colors(self, image: Image.Image,
-                     swap_map: Dict[Tuple[int, int, int], Tuple[int, int, int]]) -> Image.Image:
-        """Swap multiple colors in an image."""
-        img = image.copy()
-        data = img.load()
-        assert data is not None
+    def _build_player_stacks(self):
+        """Group player images by sprite_id and size into palette-indexed stacks."""
+        groups: Dict[Tuple[int, Tuple[int, int]], Dict[int, Tuple[Image.Image, List[Tuple]]]] = {}
+        for key, img in self.player_images.items():
+            group = groups.setdefault((key[0], img.size), {})
+            group.setdefault(id(img), (img, []))[1].append(key)
+
+        for (sprite_id, _), group in groups.items():
+            stack = np.stack([np.asarray(img) for img, _ in group.values()])
+            indices, palette = self._index_colors(stack)
+            key_groups = [keys for _, keys in group.values()]
+            self.player_stacks.setdefault(sprite_id, []).append((key_groups, indices, palette))
+
+    def _index_colors(self, pixels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split RGBA pixels (an image or a stack of them) into an index map
+        and a palette of their unique colors.
+
+        Pixels are viewed as packed uint32 so finding unique colors is a flat
+        1-D sort. Unlike PIL's 'P' mode this keeps full RGBA entries, so
+        alpha survives exactly and no quantization can merge two source colors.
+        """
+        packed = np.ascontiguousarray(pixels).view(np.uint32).reshape(-1)
+        palette, indices = np.unique(packed, return_inverse=True)
+        index_dtype = np.uint8 if len(palette) <= 256 else np.uint16
+        return indices.astype(index_dtype).reshape(pixels.shape[:-1]), palette
+
+    def _swap_palette(self, palette: np.ndarray,
+                      swap_map: Dict[Tuple[int, int, int], Tuple[int, int, int]]) -> np.ndarray:
+        """Return a copy of a packed palette with swap_map applied to its RGB bytes."""
+        new_palette = palette.copy()
+        rgb = palette & PACKED_RGB_MASK
+        for old_color, new_color in swap_map.items():
+            match = rgb == pack_rgba(*old_color, 0)
+            new_palette[match] = (palette[match] & PACKED_ALPHA_MASK) | pack_rgba(*new_color, 0)
+        return new_palette
+
+    def _expand(self, indices: np.ndarray, palette: np.ndarray) -> np.ndarray:
+        """Gather a packed palette through an index map into RGBA uint8 pixels.
+
+        The gather allocates the only output buffer of a recolor; the byte view
+        and the PIL images built on it share that memory, so it must never be
+        reused as scratch space while textures made from it are alive.
+        """
+        return palette[indices].view(np.uint8).reshape(indices.shape + (4,))
 
-        for y in range(img.height):
-            for x in range(img.width):
-                r, g, b, a = data[x, y]
-                new = swap_map.get((r, g, b))
-                if new is not None:
-                    data[x, y] = (new[0], new[1], new[2], a)
+    def _recolor(self, indexed: Tuple[np.ndarray, np.ndarray],
+                 swap_map: Dict[Tuple[int, int, int], Tuple[int, int, int]]) -> Image.Image:
+        """Apply swap_map to a palette-indexed image from _index_colors."""
+        indices, palette = indexed
+        return Image.fromarray(self._expand(indices, self._swap_palette(palette, swap_map)))
 
-        return img
+    def _recolor_player(self, sprite_id: int,
+                        swap_map: Dict[Tuple[int, int, int], Tuple[int, int, int]],
+                        tag: str) -> Dict[Tuple, arcade.Texture]:
+        """Apply swap_map to every player image of sprite_id, one gather per stack.
+
+        tag identifies the target color in the texture names.
+        """
+        textures = {}
+        for key_groups, indices, palette in self.player_stacks.get(sprite_id, ()):
+            recolored = self._expand(indices, self._swap_palette(palette, swap_map))
+            for i, keys in enumerate(key_groups):
+                texture = arcade.Texture(Image.fromarray(recolored[i]),
+                                         hash=player_texture_name(keys[0], tag),
+                                         hit_box_points=self.player_hit_boxes[keys[0]])
+                for key in keys:
+                    textures[key] = texture
+        return textures
+
+    def _cached_player_textures(self, sprite_id: int,
+                                color: Tuple[int, int, int]) -> Dict[Tuple, arcade.Texture]:
+        """Get the recolored player textures of sprite_id, building them on first use."""
+        cache_key = (sprite_id, tuple(color))
+        textures = self.recolor_cache.get(cache_key)
+        if textures is None:
+            swap = self._build_swap_map(sprite_id, SPRITE_BASE_COLORS[sprite_id], color)
+            textures = self._recolor_player(sprite_id, swap, color_tag(color))
+            self.recolor_cache[cache_key] = textures
+        return textures
+
+    def _cached_card_texture(self, sprite_id: int,
+                             color: Tuple[int, int, int]) -> Optional[arcade.Texture]:
+        """Get the recolored card texture of sprite_id, building it on first use."""
+        if sprite_id not in self.player_card_images:
+            return None
+        cache_key = (sprite_id, tuple(color))
+        texture = self.card_recolor_cache.get(cache_key)
+        if texture is None:
+            swap = self._build_swap_map(sprite_id, CARD_BASE_COLORS[sprite_id], color)
+            texture = arcade.Texture(self._recolor(self.player_card_indexed[sprite_id], swap),
+                                     hash=f"player_card_{sprite_id}_{color_tag(color)}",
+                                     hit_box_points=self.player_card_hit_boxes[sprite_id])
+            self.card_recolor_cache[cache_key] = texture
+        return texture
 
     def _build_swap_map(self, sprite_id: int, base_color: Tuple[int, int, int],
                         new_color: Tuple[int, int, int]) -> Dict[Tuple[int, int, int], Tuple[int, int, int]]:
@@ -163,22 +290,15 @@ class PlayerColorizer:
             sprite_id: The player appearance (1-4)
             color_index: Index into PLAYER_COLORS list
         """
-        sprite_base_color = SPRITE_BASE_COLORS[sprite_id]
-        card_base_color = CARD_BASE_COLORS[sprite_id]
         new_color = PLAYER_COLORS[color_index]
 
         # Regenerate player sprite textures (using sprite base color)
-        sprite_swap = self._build_swap_map(sprite_id, sprite_base_color, new_color)
-        for key, img in self.player_images.items():
-            if key[0] == sprite_id:
-                recolored = self._swap_colors(img, sprite_swap)
-                self.player_textures[key] = arcade.Texture(recolored)
+        self.player_textures.update(self._cached_player_textures(sprite_id, new_color))
 
         # Regenerate player card texture (using card base color)
-        if sprite_id in self.player_card_images:
-            card_swap = self._build_swap_map(sprite_id, card_base_color, new_color)
-            recolored_card = self._swap_colors(self.player_card_images[sprite_id], card_swap)
-            self.player_card_textures[sprite_id] = arcade.Texture(recolored_card)
+        card_texture = self._cached_card_texture(sprite_id, new_color)
+        if card_texture is not None:
+            self.player_card_textures[sprite_id] = card_texture
 
     def get_player_texture(self, sprite_id: int, state: str, direction: Direction,
                            frame: int) -> Optional[arcade.Texture]:
@@ -217,14 +337,7 @@ class PlayerColorizer:
         Returns:
             Dict mapping (sprite_id, state, direction, frame) -> recolored arcade.Texture
         """
-        base_color = SPRITE_BASE_COLORS[sprite_id]
-        swap = self._build_swap_map(sprite_id, base_color, color)
-        textures = {}
-        for key, img in self.player_images.items():
-            if key[0] == sprite_id:
-                recolored = self._swap_colors(img, swap)
-                textures[key] = arcade.Texture(recolored)
-        return textures
+        return dict(self._cached_player_textures(sprite_id, color))
 
     def create_recolored_card(self, sprite_id: int, color: Tuple[int, int, int]) -> Optional[arcade.Texture]:
         """Create a recolored player card texture.
@@ -236,9 +349,4 @@ class PlayerColorizer:
         Returns:
             Recolored arcade.Texture for the player card
         """
-        base_color = CARD_BASE_COLORS[sprite_id]
-        if sprite_id in self.player_card_images:
-            swap = self._build_swap_map(sprite_id, base_color, color)
-            recolored = self._swap_colors(self.player_card_images[sprite_id], swap)
-            return arcade.Texture(recolored)
-        return None
+        return self._cached_card_texture(sprite_id, color)
@@ -1,18 +1,35 @@
 import arcade
-from typing import Optional
 
-from game_engine.clock import Clock
 from game_engine.entities.bomb import Bomb, BombType
 
 SPRITE_SIZE = 10
 NUKE_FRAME_DURATION = 0.1  # seconds per frame for nuke animation
 FLAME_BARREL_FRAME_DURATION = 0.1  # seconds per frame for flame barrel animation
 
+# Bomb textures live in a flat list indexed by a packed integer key:
+# (bomb type index << 3) | (state code << 2) | frame
+BOMB_TYPE_INDEX = {bomb_type: index for index, bomb_type in enumerate(BombType)}
+BOMB_STATE_CODES = {'active': 0, 'defused': 1}
+DEFUSED_KEY_BIT = BOMB_STATE_CODES['defused'] << 2
+
+
+def bomb_texture_key(bomb_type: BombType, state: str, frame: int) -> int:
+    """Pack a (bomb_type, state, frame) texture key into a table index"""
+    return (BOMB_TYPE_INDEX[bomb_type] << 3) | (BOMB_STATE_CODES[state] << 2) | frame
+
+
+def build_bomb_texture_table(bomb_textures: dict, transparent_texture) -> list:
+    """Flatten a (bomb_type, state, frame) -> texture dict into a packed-key list"""
+    table = [transparent_texture] * (len(BOMB_TYPE_INDEX) << 3)
+    for (bomb_type, state, frame), texture in bomb_textures.items():
+        table[bomb_texture_key(bomb_type, state, frame)] = texture
+    return table
+
 
 class BombSprite(arcade.Sprite):
     """Sprite class for bomb entities with fuse-based animation"""
 
-    def __init__(self, bomb_textures: dict, transparent_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
+    def __init__(self, bomb_textures: list, transparent_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
         super().__init__()
         self.bomb_textures = bomb_textures
         self.transparent_texture = transparent_texture
@@ -20,91 +37,102 @@ class BombSprite(arcade.Sprite):
         self.screen_height = screen_height
         self.y_offset = y_offset
         self.map_height = map_height
+        # Pixel size of one tile and world Y of the map's top edge
+        self.tile_px = SPRITE_SIZE * zoom
+        self.map_top = map_height * self.tile_px
         self.scale = zoom
         self.texture = transparent_texture
-        # Track nuke animation state per bomb (by id)
-        self.nuke_frames = {}  # bomb_id -> last frame shown (1, 2, or 3)
-        self.nuke_last_update = {}  # bomb_id -> last frame change time
-        # Track flame barrel animation state per bomb (by id)
-        self.flame_barrel_frames = {}  # bomb_id -> last frame shown (1 or 2)
-        self.flame_barrel_last_update = {}  # bomb_id -> last frame change time
-
-    def update_from_bomb(self, bomb: Bomb, current_time: Optional[float] = None):
-        """Update sprite position and texture from bomb entity data"""
-        if current_time is None:
-            current_time = Clock.now()
+        # Table key of the texture currently shown (None for transparent)
+        self.texture_key = None
+        # Track nuke / flame barrel animation state per bomb (by id):
+        # bomb_id -> (last frame shown, last frame change time)
+        self.nuke_states = {}
+        self.flame_barrel_states = {}
+        # Bomb currently shown by this pooled sprite; its animation state is
+        # dropped once the sprite moves on to another bomb or is hidden
+        self.bomb_id = None
+
+    def update_from_bomb(self, bomb: Bomb, current_time: float):
+        """Update sprite position and texture from bomb entity data.
+
+        current_time is the frame's Clock.now(), read once by the caller.
+        """
+        if bomb.id != self.bomb_id:
+            self.forget_animation()
+            self.bomb_id = bomb.id
 
         # Position in world coordinates (Y=0 at bottom in world space)
-        self.center_x = (bomb.x + 0.5) * SPRITE_SIZE * self.zoom
-        self.center_y = (self.map_height - bomb.y - 0.5) * SPRITE_SIZE * self.zoom
+        tile_px = self.tile_px
+        # Set both axes in one write so the sprite lists update their
+        # position buffers once instead of once per axis
+        self.position = (
+            (bomb.x + 0.5) * tile_px,
+            self.map_top - (bomb.y + 0.5) * tile_px,
+        )
 
         # Get texture based on bomb type and state
+        type_key = BOMB_TYPE_INDEX[bomb.bomb_type] << 3
         if bomb.bomb_type == BombType.NUKE:
             frame = self._get_nuke_frame(bomb, current_time)
-            texture_key = (bomb.bomb_type, 'active', frame)
+            texture_key = type_key | frame
         elif bomb.bomb_type == BombType.FLAME_BARREL:
             frame = self._get_flame_barrel_frame(bomb, current_time)
-            texture_key = (bomb.bomb_type, 'active', frame)
+            texture_key = type_key | frame
         elif bomb.state == 'defused':
-            texture_key = (bomb.bomb_type, 'defused', 0)
+            texture_key = type_key | DEFUSED_KEY_BIT
         else:
             # Active bomb - select frame from fuse percentage populated by
             # the server in get_render_state (avoids client/server clock skew).
-            # First 33% (100%-67%) = frame 1, next 33% (67%-33%) = frame 2, last 33% (33%-0%) = frame 3
-            if bomb.fuse_pct > 0.67:
-                frame = 1
-            elif bomb.fuse_pct > 0.33:
-                frame = 2
-            else:
-                frame = 3
-            texture_key = (bomb.bomb_type, 'active', frame)
-
-        self.texture = self.bomb_textures.get(texture_key, self.transparent_texture)
+            # First third of the fuse (100%-67%) = frame 1, next third = frame 2,
+            # last third (33%-0%) = frame 3; a full fuse stays on frame 1
+            texture_key = type_key | (3 - min(int(bomb.fuse_pct * 3.0), 2))
+
+        if texture_key != self.texture_key:
+            self.texture_key = texture_key
+            self.texture = self.bomb_textures[texture_key]
+
+    def hide(self):
+        """Blank the sprite while it sits unused in the bomb pool"""
+        self.texture = self.transparent_texture
+        self.texture_key = None
+        self.forget_animation()
+        self.bomb_id = None
+
+    def forget_animation(self):
+        """Drop the nuke/flame barrel animation state of the bomb last shown"""
+        bomb_id = self.bomb_id
+        self.nuke_states.pop(bomb_id, None)
+        self.flame_barrel_states.pop(bomb_id, None)
 
     def _get_nuke_frame(self, bomb: Bomb, current_time: float) -> int:
         """Get the current animation frame for a nuke bomb (cycles 1->2->3->1...)"""
-        bomb_id = bomb.id
-
-        # Initialize tracking for new nukes
-        if bomb_id not in self.nuke_frames:
-            self.nuke_frames[bomb_id] = 1
-            self.nuke_last_update[bomb_id] = current_time
-
-        # If defused, return the last frame (frozen)
-        if bomb.state == 'defused':
-            return self.nuke_frames[bomb_id]
-
-        # Check if it's time to advance the frame
-        elapsed = current_time - self.nuke_last_update[bomb_id]
-        if elapsed >= NUKE_FRAME_DURATION:
-            # Advance frame (1 -> 2 -> 3 -> 1 -> ...)
-            current_frame = self.nuke_frames[bomb_id]
-            next_frame = (current_frame % 3) + 1
-            self.nuke_frames[bomb_id] = next_frame
-            self.nuke_last_update[bomb_id] = current_time
-
-        return self.nuke_frames[bomb_id]
+        return self._cycle_frame(self.nuke_states, bomb, current_time, NUKE_FRAME_DURATION, 3)
 
     def _get_flame_barrel_frame(self, bomb: Bomb, current_time: float) -> int:
         """Get the current animation frame for a flame barrel (cycles 1->2->1->2...)"""
+        return self._cycle_frame(
+            self.flame_barrel_states, bomb, current_time, FLAME_BARREL_FRAME_DURATION, 2
+        )
+
+    @staticmethod
+    def _cycle_frame(states: dict, bomb: Bomb, current_time: float, frame_duration: float,
+                     frame_count: int) -> int:
+        """Advance a looping 1..frame_count animation kept in states, one lookup per call"""
         bomb_id = bomb.id
+        state = states.get(bomb_id)
 
-        # Initialize tracking for new flame barrels
-        if bomb_id not in self.flame_barrel_frames:
-            self.flame_barrel_frames[bomb_id] = 1
-            self.flame_barrel_last_update[bomb_id] = current_time
+        # Initialize tracking for new bombs
+        if state is None:
+            state = states[bomb_id] = (1, current_time)
+        frame, last_update = state
 
         # If defused, return the last frame (frozen)
         if bomb.state == 'defused':
-            return self.flame_barrel_frames[bomb_id]
-
-        # Check if it's time to advance the frame
-        elapsed = current_time - self.flame_barrel_last_update[bomb_id]
-        if elapsed >= FLAME_BARREL_FRAME_DURATION:
-            # Advance frame (1 -> 2 -> 1 -> 2 -> ...)
-            current_frame = self.flame_barrel_frames[bomb_id]
-            next_frame = 2 if current_frame == 1 else 1
-            self.flame_barrel_frames[bomb_id] = next_frame
-            self.flame_barrel_last_update[bomb_id] = current_time
-
-        return self.flame_barrel_frames[bomb_id]
+            return frame
+
+        # Check if it's time to advance the frame (1 -> 2 -> ... -> frame_count -> 1)
+        if current_time - last_update >= frame_duration:
+            frame = (frame % frame_count) + 1
+            states[bomb_id] = (frame, current_time)
+
+        return frame
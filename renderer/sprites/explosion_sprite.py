@@ -1,10 +1,15 @@
 import arcade
-from game_engine.clock import Clock
+
 SPRITE_SIZE = 10
 
 # Animation timing (seconds per frame)
 FRAME_DURATION = 0.10
 
+# Frame sequences as indices into explosion_textures
+# (0=transparent, 1=explosion, 2=smoke1, 3=smoke2)
+EXTINGUISHER_SEQUENCE = (3, 2)  # smoke2 -> smoke1
+EXPLOSION_SEQUENCE = (1, 2, 3)  # explosion -> smoke1 -> smoke2
+
 
 class ExplosionSprite(arcade.Sprite):
     """Sprite class for explosion effects with timed animation"""
@@ -18,15 +23,19 @@ class ExplosionSprite(arcade.Sprite):
         self.scale = zoom
         self.texture = transparent_texture
 
+        # Per-type animation textures; past the end the sprite goes transparent
+        self.extinguisher_frames = tuple(explosion_textures[i] for i in EXTINGUISHER_SEQUENCE)
+        self.explosion_frames = tuple(explosion_textures[i] for i in EXPLOSION_SEQUENCE)
+
         # Animation state
         self.explosion_type = 0
         self.started_at = 0.0
 
-    def update_from_type(self, explosion_type: int, current_time: float = None):
-        """Update sprite based on explosion type from byte array"""
-        if current_time is None:
-            current_time = Clock.now()
+    def update_from_type(self, explosion_type: int, current_time: float):
+        """Update sprite based on explosion type from byte array.
 
+        current_time is the frame's Clock.now(), read once by the caller.
+        """
         # New explosion started
         if explosion_type != 0:
             self.explosion_type = explosion_type
@@ -36,31 +45,9 @@ class ExplosionSprite(arcade.Sprite):
         elapsed = current_time - self.started_at
         frame_index = int(elapsed / FRAME_DURATION)
 
-        if self.explosion_type == 4:
-            # Extinguisher smoke: smoke2 -> smoke1 -> transparent
-            if frame_index == 0:
-                self.texture = self.explosion_textures[3]
-            elif frame_index == 1:
-                self.texture = self.explosion_textures[2]
-            else:
-                self.texture = self.explosion_textures[0]
-        elif self.explosion_type == 5:
-            # Nuke explosion: explosion -> smoke1 -> smoke2 -> transparent
-            if frame_index == 0:
-                self.texture = self.explosion_textures[1]
-            elif frame_index == 1:
-                self.texture = self.explosion_textures[2]
-            elif frame_index == 2:
-                self.texture = self.explosion_textures[3]
-            else:
-                self.texture = self.explosion_textures[0]
+        # Type 4 is extinguisher smoke; nukes (5) and normal explosions share a sequence
+        frames = self.extinguisher_frames if self.explosion_type == 4 else self.explosion_frames
+        if 0 <= frame_index < len(frames):
+            self.texture = frames[frame_index]
         else:
-            # Normal explosion: explosion -> smoke1 -> smoke2 -> transparent
-            if frame_index == 0:
-                self.texture = self.explosion_textures[1]
-            elif frame_index == 1:
-                self.texture = self.explosion_textures[2]
-            elif frame_index == 2:
-                self.texture = self.explosion_textures[3]
-            else:
-                self.texture = self.explosion_textures[0]
+            self.texture = self.explosion_textures[0]
@@ -1,14 +1,29 @@
 import arcade
 
 from game_engine.entities import Direction, EntityType, DynamicEntity
+from renderer.sprites.player_sprite import DIRECTION_INDEX, FRAME_SEQUENCE, NEXT_FRAME_INDEX
 
 SPRITE_SIZE = 10
 
+# Monster textures live in a flat list indexed by a packed integer key:
+# (entity type index << 5) | (direction index << 3) | frame
+ENTITY_TYPE_INDEX = {entity_type: index for index, entity_type in enumerate(EntityType)}
+MONSTER_TEXTURE_TABLE_SIZE = len(ENTITY_TYPE_INDEX) << 5
+
+
+def build_monster_texture_table(monster_textures: dict, transparent_texture) -> list:
+    """Flatten an (entity_type, direction, frame) -> texture dict into a packed-key list"""
+    table = [transparent_texture] * MONSTER_TEXTURE_TABLE_SIZE
+    for (entity_type, direction, frame), texture in monster_textures.items():
+        key = (ENTITY_TYPE_INDEX[entity_type] << 5) | (DIRECTION_INDEX[direction] << 3) | frame
+        table[key] = texture
+    return table
+
 
 class MonsterSprite(arcade.Sprite):
     """Extended sprite class for monster entities with animation support"""
 
-    def __init__(self, entity_type: EntityType, monster_textures: dict, transparent_texture, blood_green_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
+    def __init__(self, entity_type: EntityType, monster_textures: list, transparent_texture, blood_green_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
         super().__init__()
         self.entity_type = entity_type
         self.monster_textures = monster_textures
@@ -18,12 +33,16 @@ class MonsterSprite(arcade.Sprite):
         self.screen_height = screen_height
         self.y_offset = y_offset
         self.map_height = map_height
+        # Pixel size of one tile and world Y of the map's top edge
+        self.tile_px = SPRITE_SIZE * zoom
+        self.map_top = map_height * self.tile_px
 
         # Animation state - ping-pong pattern: 1,2,3,4,3,2,1,2,3,4...
-        self.frame_sequence = [1, 2, 3, 4, 3, 2]
+        self.frame_sequence = FRAME_SEQUENCE
         self.frame_index = 0
         self.frame_timer = 0.0
         self.frames_per_second = 4  # Animation speed
+        self.frame_duration = 1.0 / self.frames_per_second
 
         # Previous state for idle frame persistence
         self.last_direction = Direction.DOWN
@@ -31,25 +50,29 @@ class MonsterSprite(arcade.Sprite):
 
         self.scale = zoom
         self.texture = transparent_texture
+        # Table key of the texture currently shown (None for blood/transparent)
+        self.texture_key = None
 
     def update_from_entity(self, monster: DynamicEntity, delta_time: float):
         """Update sprite position, texture and animation from monster entity data"""
         # Position in world coordinates (Y=0 at bottom in world space)
-        self.center_x = round(monster.x * SPRITE_SIZE) * self.zoom
-        self.center_y = (self.map_height - monster.y) * SPRITE_SIZE * self.zoom
+        self.position = (
+            round(monster.x * SPRITE_SIZE) * self.zoom,
+            self.map_top - monster.y * self.tile_px,
+        )
 
         # Handle dead state
         if monster.state == 'dead':
             self.texture = self.blood_green_texture
+            self.texture_key = None
             return
 
         # Update animation frame if walking (ping-pong: 1,2,3,4,3,2...)
         if monster.state == 'walk':
             self.frame_timer += delta_time
-            frame_duration = 1.0 / self.frames_per_second
-            if self.frame_timer >= frame_duration:
-                self.frame_timer -= frame_duration
-                self.frame_index = (self.frame_index + 1) % len(self.frame_sequence)
+            if self.frame_timer >= self.frame_duration:
+                self.frame_timer -= self.frame_duration
+                self.frame_index = NEXT_FRAME_INDEX[self.frame_index]
             self.last_direction = monster.direction
             self.last_frame = self.frame_sequence[self.frame_index]
         else:
@@ -59,8 +82,11 @@ class MonsterSprite(arcade.Sprite):
         # Get texture based on state
         current_frame = self.frame_sequence[self.frame_index]
         frame_to_use = current_frame if monster.state == 'walk' else self.last_frame
-        texture = self.monster_textures.get(
-            (monster.entity_type, monster.direction, frame_to_use),
-            self.transparent_texture
+        texture_key = (
+            (ENTITY_TYPE_INDEX[monster.entity_type] << 5)
+            | (DIRECTION_INDEX[monster.direction] << 3)
+            | frame_to_use
         )
-        self.texture = texture
+        if texture_key != self.texture_key:
+            self.texture_key = texture_key
+            self.texture = self.monster_textures[texture_key]
@@ -4,11 +4,23 @@ from game_engine.entities.pickup import Pickup
 
 SPRITE_SIZE = 10
 
+# Pickup textures live in a flat list indexed directly by visual_id, which is
+# a tile id and so always fits in a byte
+PICKUP_TEXTURE_TABLE_SIZE = 256
+
+
+def build_pickup_texture_table(pickup_textures: list, transparent_texture) -> list:
+    """Flatten a visual_id -> texture dict into a visual_id-indexed list"""
+    table = [transparent_texture] * PICKUP_TEXTURE_TABLE_SIZE
+    for visual_id, texture in pickup_textures.items():
+        table[visual_id] = texture
+    return table
+
 
 class PickupSprite(arcade.Sprite):
     """Sprite class for pickup entities (treasures, tools)"""
 
-    def __init__(self, pickup_textures: dict, transparent_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
+    def __init__(self, pickup_textures: list, transparent_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
         super().__init__()
         self.pickup_textures = pickup_textures
         self.transparent_texture = transparent_texture
@@ -16,6 +28,9 @@ class PickupSprite(arcade.Sprite):
         self.screen_height = screen_height
         self.y_offset = y_offset
         self.map_height = map_height
+        # Pixel size of one tile and world Y of the map's top edge
+        self.tile_px = SPRITE_SIZE * zoom
+        self.map_top = map_height * self.tile_px
         self.scale = zoom
         self.texture = transparent_texture
         self.visual_id = 0
@@ -23,10 +38,18 @@ class PickupSprite(arcade.Sprite):
     def update_from_pickup(self, pickup: Pickup):
         """Update sprite position and texture from pickup entity data"""
         # Position in world coordinates (Y=0 at bottom in world space)
-        self.center_x = (pickup.x + 0.5) * SPRITE_SIZE * self.zoom
-        self.center_y = (self.map_height - pickup.y - 0.5) * SPRITE_SIZE * self.zoom
+        tile_px = self.tile_px
+        self.position = (
+            (pickup.x + 0.5) * tile_px,
+            self.map_top - (pickup.y + 0.5) * tile_px,
+        )
 
         # Update texture based on visual_id
         if pickup.visual_id != self.visual_id:
             self.visual_id = pickup.visual_id
-            self.texture = self.pickup_textures.get(pickup.visual_id, self.transparent_texture)
+            self.texture = self.pickup_textures[pickup.visual_id]
+
+    def hide(self):
+        """Blank the sprite while it sits unused in the pickup pool"""
+        self.visual_id = 0
+        self.texture = self.transparent_texture
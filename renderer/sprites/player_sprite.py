@@ -4,11 +4,30 @@ from game_engine.entities import Direction, DynamicEntity
 
 SPRITE_SIZE = 10
 
+# Player textures live in a flat list indexed by a packed integer key:
+# (state index << 5) | (direction index << 3) | frame
+PLAYER_STATE_INDEX = {'walk': 0, 'idle': 1, 'dig': 2}
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(Direction)}
+PLAYER_TEXTURE_TABLE_SIZE = len(PLAYER_STATE_INDEX) << 5
+
+# Ping-pong walk cycle 1,2,3,4,3,2,1,... and the index that follows each index
+FRAME_SEQUENCE = (1, 2, 3, 4, 3, 2)
+NEXT_FRAME_INDEX = (1, 2, 3, 4, 5, 0)
+
+
+def build_player_texture_table(player_textures: dict, transparent_texture) -> list:
+    """Flatten a (sprite_id, state, direction, frame) -> texture dict for one player"""
+    table = [transparent_texture] * PLAYER_TEXTURE_TABLE_SIZE
+    for (_sprite_id, state, direction, frame), texture in player_textures.items():
+        key = (PLAYER_STATE_INDEX[state] << 5) | (DIRECTION_INDEX[direction] << 3) | frame
+        table[key] = texture
+    return table
+
 
 class PlayerSprite(arcade.Sprite):
     """Extended sprite class for player entities with animation support"""
 
-    def __init__(self, sprite_id: int, player_textures: dict, transparent_texture, blood_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
+    def __init__(self, sprite_id: int, player_textures: list, transparent_texture, blood_texture, zoom: float, screen_height: int, y_offset: float = 0, map_height: int = 45):
         super().__init__()
         self.sprite_id = sprite_id
         self.player_textures = player_textures
@@ -18,12 +37,16 @@ class PlayerSprite(arcade.Sprite):
         self.screen_height = screen_height
         self.y_offset = y_offset
         self.map_height = map_height
+        # Pixel size of one tile and world Y of the map's top edge
+        self.tile_px = SPRITE_SIZE * zoom
+        self.map_top = map_height * self.tile_px
 
         # Animation state - ping-pong pattern: 1,2,3,4,3,2,1,2,3,4...
-        self.frame_sequence = [1, 2, 3, 4, 3, 2]
+        self.frame_sequence = FRAME_SEQUENCE
         self.frame_index = 0
         self.frame_timer = 0.0
         self.frames_per_second = 4  # Animation speed
+        self.frame_duration = 1.0 / self.frames_per_second
 
         # Previous state for idle frame persistence
         self.last_direction = Direction.DOWN
@@ -31,26 +54,34 @@ class PlayerSprite(arcade.Sprite):
 
         self.scale = zoom
         self.texture = transparent_texture
+        # Table key of the texture currently shown (None for blood/transparent)
+        self.texture_key = None
 
     def update_from_entity(self, player: DynamicEntity, delta_time: float):
         """Update sprite position, texture and animation from player entity data"""
         # Position in world coordinates (Y=0 at bottom in world space)
-        self.center_x = round(player.x * SPRITE_SIZE) * self.zoom
-        self.center_y = (self.map_height - player.y) * SPRITE_SIZE * self.zoom
+        # One position write per frame (see BombSprite.update_from_bomb)
+        self.position = (
+            round(player.x * SPRITE_SIZE) * self.zoom,
+            self.map_top - player.y * self.tile_px,
+        )
 
         # Handle dead state
         if player.state == 'dead':
             self.texture = self.blood_texture
+            self.texture_key = None
             return
 
         # Update animation frame if walking or digging (ping-pong: 1,2,3,4,3,2...)
         if player.state in ('walk', 'dig'):
             self.frame_timer += delta_time
-            fps = player.get_dig_power() * 3 if player.state == 'dig' else self.frames_per_second
-            frame_duration = 1.0 / fps
+            if player.state == 'dig':
+                frame_duration = 1.0 / (player.get_dig_power() * 3)
+            else:
+                frame_duration = self.frame_duration
             if self.frame_timer >= frame_duration:
                 self.frame_timer -= frame_duration
-                self.frame_index = (self.frame_index + 1) % len(self.frame_sequence)
+                self.frame_index = NEXT_FRAME_INDEX[self.frame_index]
             self.last_direction = player.direction
             self.last_frame = self.frame_sequence[self.frame_index]
         else:
@@ -60,8 +91,12 @@ class PlayerSprite(arcade.Sprite):
         # Get texture based on state
         current_frame = self.frame_sequence[self.frame_index]
         frame_to_use = current_frame if player.state in ('walk', 'dig') else self.last_frame
-        texture = self.player_textures.get(
-            (self.sprite_id, player.state, player.direction, frame_to_use),
-            self.transparent_texture
-        )
-        self.texture = texture
+        state_index = PLAYER_STATE_INDEX.get(player.state)
+        if state_index is None:
+            self.texture = self.transparent_texture
+            self.texture_key = None
+            return
+        texture_key = (state_index << 5) | (DIRECTION_INDEX[player.direction] << 3) | frame_to_use
+        if texture_key != self.texture_key:
+            self.texture_key = texture_key
+            self.texture = self.player_textures[texture_key]
@@ -8,14 +8,15 @@ from typing import Dict, Optional, Tuple
 
 import arcade
 import numpy as np
+from arcade import gl
 from PIL import Image
 from game_engine.render_state import RenderState
 
 from common.tile_dictionary import (
     TILE_DICTIONARY,
-    EMPTY_TILE_NAMES,
-    BEDROCK_TILE_NAMES,
-    DIRT_TILE_NAMES,
+    EMPTY_TILE_IDS,
+    BEDROCK_TILE_IDS,
+    DIRT_TILE_IDS,
     BEDROCK_NW_ID,
     BEDROCK_NE_ID,
     BEDROCK_SE_ID,
@@ -53,6 +54,118 @@ VERTICAL_TRANSITION_TEXTURES = {
 
 BURNT_EMPTY_OFFSET = 256
 
+# Tile ID groups as index arrays for building the transition tables
+EMPTY_IDS = np.array(EMPTY_TILE_IDS, dtype=np.intp)
+BURNT_EMPTY_IDS = EMPTY_IDS + BURNT_EMPTY_OFFSET
+BEDROCK_IDS = np.array(BEDROCK_TILE_IDS, dtype=np.intp)
+DIRT_IDS = np.array(DIRT_TILE_IDS, dtype=np.intp)
+
+# Burnt transition textures sit this many slots after their normal variant
+BURNT_TRANSITION_OFFSET = 4
+
+# Transition indices (1-4, normal variants) for the sides each corner bedrock
+# tile exposes to a neighbouring empty tile. The direction in the name
+# indicates the dirt side(s). Horizontal: tile1 exposes RIGHT side, tile2
+# exposes LEFT side. Vertical: tile1 exposes BOTTOM side, tile2 exposes TOP side.
+#   corner id: (right, left, bottom, top)
+BEDROCK_CORNER_TRANSITIONS = {
+    BEDROCK_NW_ID: (2, 3, 2, 3),  # top=dirt, left=dirt, bottom=bedrock, right=bedrock
+    BEDROCK_NE_ID: (4, 1, 2, 3),  # top=dirt, right=dirt, bottom=bedrock, left=bedrock
+    BEDROCK_SE_ID: (4, 1, 4, 1),  # bottom=dirt, right=dirt, top=bedrock, left=bedrock
+    BEDROCK_SW_ID: (2, 3, 4, 1),  # bottom=dirt, left=dirt, top=bedrock, right=bedrock
+}
+
+
+# When at least this fraction of the map changed its transition class (the first
+# frame, or a huge blast), transitions are resolved for the whole grid with
+# sliced gathers instead of collecting and de-duplicating per-edge indices.
+DENSE_TRANSITION_FRACTION = 0.25
+
+# Dedicated atlas for the tilemap layers. Tile, transition and explosion
+# textures are all tiny, so a small atlas holds every one of them and each
+# layer draws as a single batch without touching the shared default atlas.
+# The art is drawn with nearest filtering, so a 1px border is enough to stop
+# bleeding; the atlas still grows on its own if more textures are added.
+TILE_ATLAS_SIZE = (256, 256)
+TILE_ATLAS_BORDER = 1
+
+PIXELATED_FILTER = (gl.NEAREST, gl.NEAREST)
+
+
+def pixelated_sprite_list(**kwargs) -> arcade.SpriteList:
+    """Create a SpriteList that draws with nearest filtering by default.
+
+    Pixel art is always drawn unfiltered, so setting the list's default
+    filter once lets callers use a plain draw() instead of passing
+    pixelated=True on every frame.
+    """
+    sprite_list = arcade.SpriteList(**kwargs)
+    sprite_list.DEFAULT_TEXTURE_FILTER = PIXELATED_FILTER
+    return sprite_list
+
+
+def grid_center_axes(width, height, zoom):
+    """Return world X of every column centre and world Y of every row centre.
+
+    Map row 0 is the top of the world, so world Y falls as the row grows.
+    """
+    col_centers_x = np.arange(width) * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
+    row_centers_y = (
+        (height - 1 - np.arange(height)) * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
+    )
+    return col_centers_x, row_centers_y
+
+
+def grid_positions(xs, ys):
+    """Combine per-column X and per-row Y into flat row-major position lists."""
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    return grid_x.ravel().tolist(), grid_y.ravel().tolist()
+
+
+def grid_center_positions(width, height, zoom):
+    """Return flat row-major lists of world (x, y) tile centres for a map grid."""
+    return grid_positions(*grid_center_axes(width, height, zoom))
+
+
+def _make_grid_sprites(positions, zoom, texture) -> list:
+    """Create a row-major pool of grid sprites showing a starting texture.
+
+    Texture, scale and position go straight to the constructor, so each
+    sprite is set up once instead of recomputing its size and hit box in
+    three separate setters.
+    """
+    return [
+        arcade.Sprite(texture, scale=zoom, center_x=x, center_y=y)
+        for x, y in zip(*positions)
+    ]
+
+
+def texture_table(textures) -> np.ndarray:
+    """Pack textures into an object array so ID arrays can gather them in one call."""
+    table = np.empty(len(textures), dtype=object)
+    table[:] = list(textures)
+    return table
+
+
+def _update_changed_textures(sprites, textures, sprite_indices, new_ids, current_ids):
+    """Assign textures to the listed sprites whose ID differs from the one shown.
+
+    textures is a texture_table indexed by ID. sprite_indices are flat
+    row-major map indices and new_ids the IDs they should show; current_ids
+    is the flat array of shown IDs, updated in place.
+
+    Callers pass sprite_indices in ascending order (np.flatnonzero or
+    np.unique output). The grid sprites were appended row-major, so each
+    sprite list's buffer slots are then written front to back, one list at
+    a time.
+    """
+    changed = new_ids != current_ids[sprite_indices]
+    sprite_indices = sprite_indices[changed]
+    new_ids = new_ids[changed]
+    current_ids[sprite_indices] = new_ids
+    for sprite_idx, texture in zip(sprite_indices.tolist(), np.take(textures, new_ids).tolist()):
+        sprites[sprite_idx].texture = texture
+
 
 class TileRenderer:
     """Handles background tile and transition rendering."""
@@ -61,22 +174,6 @@ class TileRenderer:
         self.zoom = zoom
         self.transparent_texture = transparent_texture
 
-        EMPTY_TILE_IDS = {
-            tile_id
-            for tile_id, name in TILE_DICTIONARY.items()
-            if name in EMPTY_TILE_NAMES
-        }
-        BEDROCK_TILE_IDS = {
-            tile_id
-            for tile_id, name in TILE_DICTIONARY.items()
-            if name in BEDROCK_TILE_NAMES
-        }
-        DIRT_TILE_IDS = {
-            tile_id
-            for tile_id, name in TILE_DICTIONARY.items()
-            if name in DIRT_TILE_NAMES
-        }
-
         # Load sprite textures from files
         self.textures = {}
         for tile_id, sprite_name in TILE_DICTIONARY.items():
@@ -124,188 +221,187 @@ class TileRenderer:
         ]
 
         # Lookup tables: [effective_tile_id_1, effective_tile_id_2] -> texture index
-        # 512x512 to accommodate burnt empty IDs (normal ID + 256)
-        self.horizontal_transition_lookup = np.zeros((512, 512), dtype=np.uint8)
-        self.vertical_transition_lookup = np.zeros((512, 512), dtype=np.uint8)
-
-        empty_ids = np.array(list(EMPTY_TILE_IDS))
-        bedrock_ids = np.array(list(BEDROCK_TILE_IDS))
-        dirt_ids = np.array(list(DIRT_TILE_IDS))
-        burnt_empty_ids = empty_ids + BURNT_EMPTY_OFFSET
+        # 512x512 to accommodate burnt empty IDs (normal ID + 256). Almost all
+        # of their rows are zero; they are only used to derive the compact
+        # class tables below and are not kept on the renderer.
+        horizontal_transition_lookup = np.zeros((512, 512), dtype=np.uint8)
+        vertical_transition_lookup = np.zeros((512, 512), dtype=np.uint8)
 
         # Empty <-> Bedrock transitions (normal)
-        self.horizontal_transition_lookup[np.ix_(empty_ids, bedrock_ids)] = 1
-        self.horizontal_transition_lookup[np.ix_(bedrock_ids, empty_ids)] = 2
-        self.vertical_transition_lookup[np.ix_(empty_ids, bedrock_ids)] = 1
-        self.vertical_transition_lookup[np.ix_(bedrock_ids, empty_ids)] = 2
+        horizontal_transition_lookup[np.ix_(EMPTY_IDS, BEDROCK_IDS)] = 1
+        horizontal_transition_lookup[np.ix_(BEDROCK_IDS, EMPTY_IDS)] = 2
+        vertical_transition_lookup[np.ix_(EMPTY_IDS, BEDROCK_IDS)] = 1
+        vertical_transition_lookup[np.ix_(BEDROCK_IDS, EMPTY_IDS)] = 2
 
         # Empty <-> Dirt transitions (normal)
-        self.horizontal_transition_lookup[np.ix_(empty_ids, dirt_ids)] = 3
-        self.horizontal_transition_lookup[np.ix_(dirt_ids, empty_ids)] = 4
-        self.vertical_transition_lookup[np.ix_(empty_ids, dirt_ids)] = 3
-        self.vertical_transition_lookup[np.ix_(dirt_ids, empty_ids)] = 4
+        horizontal_transition_lookup[np.ix_(EMPTY_IDS, DIRT_IDS)] = 3
+        horizontal_transition_lookup[np.ix_(DIRT_IDS, EMPTY_IDS)] = 4
+        vertical_transition_lookup[np.ix_(EMPTY_IDS, DIRT_IDS)] = 3
+        vertical_transition_lookup[np.ix_(DIRT_IDS, EMPTY_IDS)] = 4
 
         # Burnt empty <-> Bedrock transitions
-        self.horizontal_transition_lookup[np.ix_(burnt_empty_ids, bedrock_ids)] = 5
-        self.horizontal_transition_lookup[np.ix_(bedrock_ids, burnt_empty_ids)] = 6
-        self.vertical_transition_lookup[np.ix_(burnt_empty_ids, bedrock_ids)] = 5
-        self.vertical_transition_lookup[np.ix_(bedrock_ids, burnt_empty_ids)] = 6
+        horizontal_transition_lookup[np.ix_(BURNT_EMPTY_IDS, BEDROCK_IDS)] = 5
+        horizontal_transition_lookup[np.ix_(BEDROCK_IDS, BURNT_EMPTY_IDS)] = 6
+        vertical_transition_lookup[np.ix_(BURNT_EMPTY_IDS, BEDROCK_IDS)] = 5
+        vertical_transition_lookup[np.ix_(BEDROCK_IDS, BURNT_EMPTY_IDS)] = 6
 
         # Burnt empty <-> Dirt transitions
-        self.horizontal_transition_lookup[np.ix_(burnt_empty_ids, dirt_ids)] = 7
-        self.horizontal_transition_lookup[np.ix_(dirt_ids, burnt_empty_ids)] = 8
-        self.vertical_transition_lookup[np.ix_(burnt_empty_ids, dirt_ids)] = 7
-        self.vertical_transition_lookup[np.ix_(dirt_ids, burnt_empty_ids)] = 8
-
-        # Corner bedrock tiles have directional transitions
-        # The direction in the name indicates the dirt side(s)
-        # Horizontal: tile1 exposes RIGHT side, tile2 exposes LEFT side
-        # Vertical: tile1 exposes BOTTOM side, tile2 exposes TOP side
-
-        # bedrock_nw: top=dirt, left=dirt, bottom=bedrock, right=bedrock
-        self.horizontal_transition_lookup[BEDROCK_NW_ID, empty_ids] = 2  # right=bedrock
-        self.horizontal_transition_lookup[empty_ids, BEDROCK_NW_ID] = 3  # left=dirt
-        self.vertical_transition_lookup[BEDROCK_NW_ID, empty_ids] = 2  # bottom=bedrock
-        self.vertical_transition_lookup[empty_ids, BEDROCK_NW_ID] = 3  # top=dirt
-        self.horizontal_transition_lookup[BEDROCK_NW_ID, burnt_empty_ids] = 6
-        self.horizontal_transition_lookup[burnt_empty_ids, BEDROCK_NW_ID] = 7
-        self.vertical_transition_lookup[BEDROCK_NW_ID, burnt_empty_ids] = 6
-        self.vertical_transition_lookup[burnt_empty_ids, BEDROCK_NW_ID] = 7
-
-        # bedrock_ne: top=dirt, right=dirt, bottom=bedrock, left=bedrock
-        self.horizontal_transition_lookup[BEDROCK_NE_ID, empty_ids] = 4  # right=dirt
-        self.horizontal_transition_lookup[empty_ids, BEDROCK_NE_ID] = 1  # left=bedrock
-        self.vertical_transition_lookup[BEDROCK_NE_ID, empty_ids] = 2  # bottom=bedrock
-        self.vertical_transition_lookup[empty_ids, BEDROCK_NE_ID] = 3  # top=dirt
-        self.horizontal_transition_lookup[BEDROCK_NE_ID, burnt_empty_ids] = 8
-        self.horizontal_transition_lookup[burnt_empty_ids, BEDROCK_NE_ID] = 5
-        self.vertical_transition_lookup[BEDROCK_NE_ID, burnt_empty_ids] = 6
-        self.vertical_transition_lookup[burnt_empty_ids, BEDROCK_NE_ID] = 7
-
-        # bedrock_se: bottom=dirt, right=dirt, top=bedrock, left=bedrock
-        self.horizontal_transition_lookup[BEDROCK_SE_ID, empty_ids] = 4  # right=dirt
-        self.horizontal_transition_lookup[empty_ids, BEDROCK_SE_ID] = 1  # left=bedrock
-        self.vertical_transition_lookup[BEDROCK_SE_ID, empty_ids] = 4  # bottom=dirt
-        self.vertical_transition_lookup[empty_ids, BEDROCK_SE_ID] = 1  # top=bedrock
-        self.horizontal_transition_lookup[BEDROCK_SE_ID, burnt_empty_ids] = 8
-        self.horizontal_transition_lookup[burnt_empty_ids, BEDROCK_SE_ID] = 5
-        self.vertical_transition_lookup[BEDROCK_SE_ID, burnt_empty_ids] = 8
-        self.vertical_transition_lookup[burnt_empty_ids, BEDROCK_SE_ID] = 5
-
-        # bedrock_sw: bottom=dirt, left=dirt, top=bedrock, right=bedrock
-        self.horizontal_transition_lookup[BEDROCK_SW_ID, empty_ids] = 2  # right=bedrock
-        self.horizontal_transition_lookup[empty_ids, BEDROCK_SW_ID] = 3  # left=dirt
-        self.vertical_transition_lookup[BEDROCK_SW_ID, empty_ids] = 4  # bottom=dirt
-        self.vertical_transition_lookup[empty_ids, BEDROCK_SW_ID] = 1  # top=bedrock
-        self.horizontal_transition_lookup[BEDROCK_SW_ID, burnt_empty_ids] = 6
-        self.horizontal_transition_lookup[burnt_empty_ids, BEDROCK_SW_ID] = 7
-        self.vertical_transition_lookup[BEDROCK_SW_ID, burnt_empty_ids] = 8
-        self.vertical_transition_lookup[burnt_empty_ids, BEDROCK_SW_ID] = 5
+        horizontal_transition_lookup[np.ix_(BURNT_EMPTY_IDS, DIRT_IDS)] = 7
+        horizontal_transition_lookup[np.ix_(DIRT_IDS, BURNT_EMPTY_IDS)] = 8
+        vertical_transition_lookup[np.ix_(BURNT_EMPTY_IDS, DIRT_IDS)] = 7
+        vertical_transition_lookup[np.ix_(DIRT_IDS, BURNT_EMPTY_IDS)] = 8
+
+        # Corner bedrock tiles have directional transitions (see
+        # BEDROCK_CORNER_TRANSITIONS). Every corner's rules against every
+        # empty and burnt empty ID are written in one flat put per side.
+        corner_ids = np.array(list(BEDROCK_CORNER_TRANSITIONS), dtype=np.intp)[:, None]
+        corner_rules = np.array(list(BEDROCK_CORNER_TRANSITIONS.values()), dtype=np.uint8)
+        other_ids = np.concatenate((EMPTY_IDS, BURNT_EMPTY_IDS))
+        burnt_shift = np.repeat(
+            np.array([0, BURNT_TRANSITION_OFFSET], dtype=np.uint8),
+            [len(EMPTY_IDS), len(BURNT_EMPTY_IDS)],
+        )
+        corner_first = (corner_ids * 512 + other_ids).ravel()
+        corner_second = (other_ids * 512 + corner_ids).ravel()
+        for lookup, first_rule, second_rule in (
+            (horizontal_transition_lookup, 0, 1),
+            (vertical_transition_lookup, 2, 3),
+        ):
+            np.put(lookup, corner_first, (corner_rules[:, [first_rule]] + burnt_shift).ravel())
+            np.put(lookup, corner_second, (corner_rules[:, [second_rule]] + burnt_shift).ravel())
+
+        # Compress the 512 effective IDs into a handful of transition classes.
+        # IDs whose rows and columns match in both tables behave identically,
+        # so every transition resolves from a tiny KxK table that stays in L1
+        # instead of the two 256 KiB ones above.
+        signatures = np.concatenate(
+            (
+                horizontal_transition_lookup,
+                horizontal_transition_lookup.T,
+                vertical_transition_lookup,
+                vertical_transition_lookup.T,
+            ),
+            axis=1,
+        )
+        _, class_representatives, transition_class = np.unique(
+            signatures, axis=0, return_index=True, return_inverse=True
+        )
+        # There are far fewer than 256 classes, so each map cell keeps its
+        # class as a single byte (see effective_class below)
+        self.transition_class = transition_class.reshape(-1).astype(np.uint8)
+
+        # Class lookups are indexed by a packed (class_a << shift) | class_b
+        # key so a pair of classes resolves with a single flat gather
+        self.transition_key_shift = max(1, (len(class_representatives) - 1).bit_length())
+        class_pairs = np.ix_(class_representatives, class_representatives)
+        lookup_size = 1 << self.transition_key_shift
+        self.horizontal_transition_class_lookup = np.zeros(lookup_size * lookup_size, dtype=np.uint8)
+        self.vertical_transition_class_lookup = np.zeros(lookup_size * lookup_size, dtype=np.uint8)
+        self.horizontal_transition_class_lookup.reshape(lookup_size, lookup_size)[
+            : len(class_representatives), : len(class_representatives)
+        ] = horizontal_transition_lookup[class_pairs]
+        self.vertical_transition_class_lookup.reshape(lookup_size, lookup_size)[
+            : len(class_representatives), : len(class_representatives)
+        ] = vertical_transition_lookup[class_pairs]
 
         # Precompute which tile IDs are "empty" for effective tilemap building
         self.is_empty_tile = np.zeros(256, dtype=np.uint16)
-        for eid in EMPTY_TILE_IDS:
-            self.is_empty_tile[eid] = BURNT_EMPTY_OFFSET
-
-        # Map tile IDs to textures
-        self.tile_id_to_texture_dictionary = list()
-
-        for j in range(255):
-            self.tile_id_to_texture_dictionary.insert(j, transparent_texture)
+        self.is_empty_tile[EMPTY_IDS] = BURNT_EMPTY_OFFSET
 
+        # Map tile IDs to textures; unknown IDs render as transparent
+        self.tile_id_to_texture_dictionary = texture_table([transparent_texture] * 256)
         for tile_id, sprite_name in TILE_DICTIONARY.items():
-            self.tile_id_to_texture_dictionary.insert(
-                tile_id, self.textures[sprite_name]
-            )
+            self.tile_id_to_texture_dictionary[tile_id] = self.textures[sprite_name]
+
+        # Object-array forms of the transition lists for gathers in on_update
+        self.horizontal_transition_texture_table = texture_table(
+            self.horizontal_transition_textures_list
+        )
+        self.vertical_transition_texture_table = texture_table(
+            self.vertical_transition_textures_list
+        )
 
         # Track which tiles have ever had an explosion (for burnt transitions)
         self.explosion_history = np.zeros((state.height, state.width), dtype=bool)
+        # Scratch buffer for the cells each update sees burning for the first time
+        self.new_burns = np.empty(state.width * state.height, dtype=bool)
+        # All-False change mask for updates that carry no new tilemap
+        self.no_tile_changes = np.zeros(state.width * state.height, dtype=bool)
+
+        # Transition class of each cell's effective (burnt-aware) tile ID,
+        # kept up to date incrementally: it starts as the class of tile 0 to
+        # match the tile IDs the sprites start with, and on_update patches
+        # only the cells whose tile changed or that newly burnt. Transitions
+        # depend only on the class, so the map is stored as uint8 classes
+        # instead of uint16 effective IDs.
+        self.effective_class = np.full(
+            (state.height, state.width), self.transition_class[0], dtype=np.uint8
+        )
+        # Transitions are resolved over the whole map on the first update
+        self.transitions_resolved = False
+
+        # Tilemap array of the last processed state. Each render state carries
+        # a freshly decoded tilemap, so receiving the same array object again
+        # with no new explosions means nothing on the map can have changed.
+        self.last_tilemap: Optional[np.ndarray] = None
+
+        # Flat row-major IDs currently shown by each sprite, so on_update only
+        # touches cells that changed. All start at 0: tile sprites are created
+        # showing tile 0's texture, transitions the transparent one. The tile
+        # IDs share the tilemap's uint8 dtype so the per-update diff is a
+        # straight byte compare with no promotion.
+        tile_count = state.width * state.height
+        self.current_tile_ids = np.zeros(tile_count, dtype=np.uint8)
+        self.current_horizontal_transition_ids = np.zeros(tile_count, dtype=np.uint8)
+        self.current_vertical_transition_ids = np.zeros(tile_count, dtype=np.uint8)
+
+        # Shared atlas for all tilemap layers, filled once up front
+        self.atlas = arcade.DefaultTextureAtlas(TILE_ATLAS_SIZE, border=TILE_ATLAS_BORDER)
+        self.atlas.add(transparent_texture)
+        for texture in self.textures.values():
+            self.atlas.add(texture)
+        for texture in self.horizontal_transition_textures_list[1:]:
+            self.atlas.add(texture)
+        for texture in self.vertical_transition_textures_list[1:]:
+            self.atlas.add(texture)
+
+        # All tilemap layers live in one sprite list so they draw in a single
+        # batch. Insertion order is draw order: background tiles, then
+        # vertical transitions, then horizontal transitions.
+        self.tilemap_sprite_list = pixelated_sprite_list(
+            atlas=self.atlas, capacity=3 * state.width * state.height
+        )
+        self.tilemap_sprite_list.initialize()
 
         # Background tile sprites - one per map tile at world positions
-        self.background_tile_sprite_list = arcade.SpriteList()
-        self.background_tile_sprite_list.initialize()
-        self.background_tile_sprite_list.preload_textures(self.textures.values())
-        tile_sprite_count = state.width * state.height
-        self.sprites = [arcade.Sprite() for _ in range(tile_sprite_count)]
-
-        # Position sprites at world coordinates (Y increases upward in world space)
-        sprite_idx = 0
-        for y in range(state.height):
-            # World Y: row 0 at bottom, row (height-1) at top
-            world_y = (
-                state.height - 1 - y
-            ) * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-            for x in range(state.width):
-                world_x = x * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-                sprite = self.sprites[sprite_idx]
-                sprite.center_x = world_x
-                sprite.center_y = world_y
-                sprite.scale = zoom
-                sprite.texture = transparent_texture
-                sprite_idx += 1
-
-        self.background_tile_sprite_list.extend(self.sprites)
-
-        # Horizontal transition sprites - between columns
-        h_transition_count = state.width * state.height
-        self.horizontal_transition_sprite_list = arcade.SpriteList()
-        self.horizontal_transition_sprite_list.initialize()
-        self.horizontal_transition_sprite_list.preload_textures(
-            horizontal_transition_textures.values()
+        # (Y increases upward in world space). Column/row centres are
+        # computed once and shared by every grid pool
+        col_centers_x, row_centers_y = grid_center_axes(state.width, state.height, zoom)
+        tile_positions = grid_positions(col_centers_x, row_centers_y)
+        self.sprites = _make_grid_sprites(
+            tile_positions, zoom, self.tile_id_to_texture_dictionary[0]
         )
-        self.horizontal_transition_sprites = [
-            arcade.Sprite() for _ in range(h_transition_count)
-        ]
 
-        sprite_idx = 0
-        for y in range(state.height):
-            world_y = (
-                state.height - 1 - y
-            ) * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-            for x in range(state.width):
-                sprite = self.horizontal_transition_sprites[sprite_idx]
-                # Position at midpoint between tile x and tile x+1
-                world_x = (x + 1) * SPRITE_SIZE * zoom
-                sprite.center_x = world_x
-                sprite.center_y = world_y
-                sprite.scale = zoom
-                sprite.texture = transparent_texture
-                sprite_idx += 1
-
-        self.horizontal_transition_sprite_list.extend(
-            self.horizontal_transition_sprites
+        # Horizontal transition sprites - at the midpoint between tile x and x+1
+        self.horizontal_transition_sprites = _make_grid_sprites(
+            grid_positions(col_centers_x + SPRITE_CENTER_OFFSET * zoom, row_centers_y),
+            zoom,
+            transparent_texture,
         )
 
-        # Vertical transition sprites - between rows
-        v_transition_count = state.width * state.height
-        self.vertical_transition_sprite_list = arcade.SpriteList()
-        self.vertical_transition_sprite_list.initialize()
-        self.vertical_transition_sprite_list.preload_textures(
-            vertical_transition_textures.values()
+        # Vertical transition sprites - at the boundary between row y and y+1
+        self.vertical_transition_sprites = _make_grid_sprites(
+            grid_positions(col_centers_x, row_centers_y - SPRITE_CENTER_OFFSET * zoom),
+            zoom,
+            transparent_texture,
         )
-        self.vertical_transition_sprites = [
-            arcade.Sprite() for _ in range(v_transition_count)
-        ]
 
-        sprite_idx = 0
-        for y in range(state.height):
-            # Position at boundary between row y and row y+1
-            world_y = (
-                state.height - 1 - y - 1
-            ) * SPRITE_SIZE * zoom + SPRITE_SIZE * zoom
-            for x in range(state.width):
-                sprite = self.vertical_transition_sprites[sprite_idx]
-                world_x = x * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-                sprite.center_x = world_x
-                sprite.center_y = world_y
-                sprite.scale = zoom
-                sprite.texture = transparent_texture
-                sprite_idx += 1
-
-        self.vertical_transition_sprite_list.extend(self.vertical_transition_sprites)
+        self.tilemap_sprite_list.extend(self.sprites)
+        self.tilemap_sprite_list.extend(self.vertical_transition_sprites)
+        self.tilemap_sprite_list.extend(self.horizontal_transition_sprites)
 
         # Grid line overlay for diagnostics
-        self.grid_sprite_list = arcade.SpriteList()
+        self.grid_sprite_list = pixelated_sprite_list()
         if show_grid:
             grid_image = Image.new("RGBA", (1, 1), (0, 0, 0, 64))
             grid_texture = arcade.Texture(grid_image, name="grid_line")
@@ -342,31 +438,17 @@ class TileRenderer:
         self._color_tile_cache: Dict[Tuple[int, int, int], arcade.Texture] = {}
         self._black_tile_texture = self._make_color_tile_texture((0, 0, 0))
 
-        self.overlay_sprite_list = arcade.SpriteList()
+        self.overlay_sprite_list = pixelated_sprite_list()
         self.overlay_sprite_list.initialize()
-        self.overlay_sprites = [
-            arcade.Sprite() for _ in range(state.width * state.height)
-        ]
-        sprite_idx = 0
-        for y in range(state.height):
-            world_y = (
-                state.height - 1 - y
-            ) * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-            for x in range(state.width):
-                world_x = x * SPRITE_SIZE * zoom + SPRITE_CENTER_OFFSET * zoom
-                sprite = self.overlay_sprites[sprite_idx]
-                sprite.center_x = world_x
-                sprite.center_y = world_y
-                sprite.scale = zoom
-                sprite.texture = transparent_texture
-                sprite_idx += 1
+        self.overlay_sprites = _make_grid_sprites(tile_positions, zoom, transparent_texture)
         self.overlay_sprite_list.extend(self.overlay_sprites)
 
         # Track each overlay sprite's currently-bound texture so we only
-        # reassign when it actually changes (avoids buffer churn).
-        self._overlay_current_textures: list = [
-            transparent_texture for _ in self.overlay_sprites
-        ]
+        # reassign when it actually changes (avoids buffer churn). Kept as a
+        # flat object array so the diff against a new frame is one C-level
+        # comparison instead of a Python loop over every tile.
+        self._overlay_current_textures = np.empty(len(self.overlay_sprites), dtype=object)
+        self._overlay_current_textures[:] = [transparent_texture] * len(self.overlay_sprites)
 
     def _make_color_tile_texture(self, rgb: Tuple[int, int, int]) -> arcade.Texture:
         img = Image.new("RGBA", (SPRITE_SIZE, SPRITE_SIZE), (rgb[0], rgb[1], rgb[2], 255))
@@ -403,10 +485,9 @@ class TileRenderer:
         H, W = state.height, state.width
 
         def assign_all(texture):
-            for i, sprite in enumerate(self.overlay_sprites):
-                if self._overlay_current_textures[i] is not texture:
-                    sprite.texture = texture
-                    self._overlay_current_textures[i] = texture
+            new_textures = np.empty(H * W, dtype=object)
+            new_textures[:] = [texture] * (H * W)
+            self._assign_overlay_textures(new_textures)
 
         if countdown is None or countdown <= 0:
             assign_all(self.transparent_texture)
@@ -465,70 +546,176 @@ class TileRenderer:
             self._get_color_tile_texture(e.color) for e in enemies
         ] if enemy_marks_active else []
 
-        for y in range(H):
-            for x in range(W):
-                idx = y * W + x
-                if revealed_mask[y, x]:
-                    tex = self.transparent_texture
-                elif client_mask[y, x]:
-                    tex = client_tex
-                else:
-                    tex = self._black_tile_texture
-                    if enemy_marks_active:
-                        for em, et in zip(enemy_masks, enemy_texs):
-                            if em[y, x]:
-                                tex = et
-                                break
-                if self._overlay_current_textures[idx] is not tex:
-                    self.overlay_sprites[idx].texture = tex
-                    self._overlay_current_textures[idx] = tex
-
-    def on_update(
-        self,
-        state: RenderState,
-        view_start_x: int,
-        view_end_x: int,
-        view_start_y: int,
-        view_end_y: int,
-    ) -> None:
-        """Update visible tile textures and transitions."""
-        # Accumulate explosion history (OR in new explosions)
-        self.explosion_history |= state.explosions.astype(bool)
-
-        # Build effective tilemap: empty tiles with explosion history get shifted IDs
-        # is_empty_tile[id] = 256 for empty tiles, 0 otherwise
-        # explosion_history is bool, so multiplying gives 256 or 0
-        effective_tilemap = (
-            state.tilemap.astype(np.uint16)
-            + self.is_empty_tile[state.tilemap] * self.explosion_history
-        )
+        # Resolve the texture of every tile as an index into a small palette
+        # of this frame's textures, with later writes taking precedence:
+        # black < enemy blocks (first enemy wins) < client block < revealed.
+        palette = [self.transparent_texture, self._black_tile_texture, client_tex]
+        palette.extend(enemy_texs)
+        texture_idx = np.ones((H, W), dtype=np.intp)
+        for enemy_idx in range(len(enemy_masks) - 1, -1, -1):
+            texture_idx[enemy_masks[enemy_idx]] = 3 + enemy_idx
+        texture_idx[client_mask] = 2
+        texture_idx[revealed_mask] = 0
+
+        palette_array = np.empty(len(palette), dtype=object)
+        palette_array[:] = palette
+        self._assign_overlay_textures(palette_array[texture_idx.reshape(-1)])
+
+    def _assign_overlay_textures(self, new_textures: np.ndarray) -> None:
+        """Bind new_textures (flat, row-major) to the overlay sprites whose texture differs."""
+        current_textures = self._overlay_current_textures
+        overlay_sprites = self.overlay_sprites
+        changed = np.flatnonzero(new_textures != current_textures)
+        for idx in changed.tolist():
+            texture = new_textures[idx]
+            overlay_sprites[idx].texture = texture
+            current_textures[idx] = texture
+
+    def on_update(self, state: RenderState) -> None:
+        """Update tile textures and transitions for cells that changed.
+
+        Only changed tiles are re-textured, and transitions are resolved only
+        for the edges touching a cell whose transition class changed, so the whole
+        map stays current regardless of the camera position.
+        """
+        tilemap = state.tilemap
+        has_explosions = state.explosions.any()
+        same_tilemap = tilemap is self.last_tilemap
+        if same_tilemap and not has_explosions:
+            return
+        self.last_tilemap = tilemap
+
+        # Cells to revisit: tiles whose ID changed, plus empty tiles that just
+        # burnt for the first time. Everything else keeps its effective ID.
+        tile_ids = tilemap.reshape(-1)
+        current_tile_ids = self.current_tile_ids
+        # The same tilemap object cannot hold edits, so only new burns are
+        # dirty and the full-map tile compare is skipped
+        if same_tilemap:
+            tile_changed = self.no_tile_changes
+        else:
+            tile_changed = tile_ids != current_tile_ids
+        history = self.explosion_history.reshape(-1)
+        if has_explosions:
+            # Reused bool buffer; True > False picks cells burning for the
+            # first time without allocating ~history
+            new_burns = self.new_burns
+            np.not_equal(state.explosions.reshape(-1), 0, out=new_burns)
+            np.greater(new_burns, history, out=new_burns)
+            history |= new_burns
+            new_burns |= tile_changed
+            cells = np.flatnonzero(new_burns)
+        else:
+            cells = np.flatnonzero(tile_changed)
+
+        # Tile textures (no position updates needed - camera handles scrolling)
+        changed_tiles = cells[tile_changed[cells]]
+        if changed_tiles.size:
+            _update_changed_textures(
+                self.sprites,
+                self.tile_id_to_texture_dictionary,
+                changed_tiles,
+                tile_ids[changed_tiles],
+                current_tile_ids,
+            )
 
-        # Update only visible tile textures (no position updates needed - camera handles scrolling)
-        for y in range(view_start_y, view_end_y):
-            for x in range(view_start_x, view_end_x):
-                sprite_idx = y * state.width + x
-                self.sprites[sprite_idx].texture = self.tile_id_to_texture_dictionary[
-                    state.tilemap[y, x]
-                ]
-
-        # Update visible horizontal transitions
-        for y in range(view_start_y, view_end_y):
-            for x in range(view_start_x, min(view_end_x, state.width - 1)):
-                sprite_idx = y * state.width + x
-                transition_idx = self.horizontal_transition_lookup[
-                    effective_tilemap[y, x], effective_tilemap[y, x + 1]
-                ]
-                self.horizontal_transition_sprites[sprite_idx].texture = (
-                    self.horizontal_transition_textures_list[transition_idx]
-                )
+        # Patch the effective classes at the revisited cells:
+        # is_empty_tile[id] is 256 for empty tiles and 0 otherwise, and the
+        # explosion history is bool, so burnt empty tiles get shifted IDs
+        class_flat = self.effective_class.reshape(-1)
+        cell_ids = tile_ids[cells]
+        cell_effective = np.take(self.is_empty_tile, cell_ids) * history[cells] + cell_ids
+        cell_classes = np.take(self.transition_class, cell_effective)
+        class_changed = cell_classes != class_flat[cells]
+        changed_cells = cells[class_changed]
+        class_flat[changed_cells] = cell_classes[class_changed]
+
+        # The first update resolves every transition; after that transitions
+        # only change next to a cell whose class changed
+        if not self.transitions_resolved:
+            self.transitions_resolved = True
+            self._update_all_transitions()
+            return
+        if changed_cells.size == 0:
+            return
+        rows, cols = np.divmod(changed_cells, state.width)
+        width, height = state.width, state.height
 
-        # Update visible vertical transitions
-        for y in range(view_start_y, min(view_end_y, state.height - 1)):
-            for x in range(view_start_x, view_end_x):
-                sprite_idx = y * state.width + x
-                transition_idx = self.vertical_transition_lookup[
-                    effective_tilemap[y, x], effective_tilemap[y + 1, x]
-                ]
-                self.vertical_transition_sprites[sprite_idx].texture = (
-                    self.vertical_transition_textures_list[transition_idx]
+        if rows.size >= DENSE_TRANSITION_FRACTION * width * height:
+            self._update_all_transitions()
+            return
+
+        shift = self.transition_key_shift
+
+        # Horizontal transitions at (y, x) sit between tiles x and x+1, so a
+        # changed tile affects the transitions at x-1 and x
+        h_rows = np.concatenate((rows, rows))
+        h_cols = np.concatenate((cols - 1, cols))
+        in_map = (h_cols >= 0) & (h_cols < width - 1)
+        h_indices = np.unique(h_rows[in_map] * width + h_cols[in_map])
+        if h_indices.size:
+            # Classes are gathered only for the edges being resolved. All the
+            # tables are flat contiguous arrays, so np.take's 1-D gather loop
+            # is used rather than generic advanced indexing. Keys are widened
+            # to uint16 as they are packed.
+            h_keys = np.left_shift(np.take(class_flat, h_indices), shift, dtype=np.uint16)
+            h_keys |= np.take(class_flat, h_indices + 1)
+            _update_changed_textures(
+                self.horizontal_transition_sprites,
+                self.horizontal_transition_texture_table,
+                h_indices,
+                np.take(self.horizontal_transition_class_lookup, h_keys),
+                self.current_horizontal_transition_ids,
+            )
+
+        # Vertical transitions at (y, x) sit between rows y and y+1
+        v_rows = np.concatenate((rows - 1, rows))
+        v_cols = np.concatenate((cols, cols))
+        in_map = (v_rows >= 0) & (v_rows < height - 1)
+        v_indices = np.unique(v_rows[in_map] * width + v_cols[in_map])
+        if v_indices.size:
+            v_keys = np.left_shift(np.take(class_flat, v_indices), shift, dtype=np.uint16)
+            v_keys |= np.take(class_flat, v_indices + width)
+            _update_changed_textures(
+                self.vertical_transition_sprites,
+                self.vertical_transition_texture_table,
+                v_indices,
+                np.take(self.vertical_transition_class_lookup, v_keys),
+                self.current_vertical_transition_ids,
+            )
+
+    def _update_all_transitions(self) -> None:
+        """Resolve every transition on the map with whole-grid gathers.
+
+        Transition IDs are laid out like the sprites (row-major, map-sized);
+        the last column has no horizontal transition and the last row no
+        vertical one, so those slots stay 0 (transparent).
+        """
+        classes = self.effective_class
+        height, width = classes.shape
+        keys = np.left_shift(classes, self.transition_key_shift, dtype=np.uint16)
+
+        h_ids = np.zeros((height, width), dtype=np.uint8)
+        h_ids[:, :-1] = np.take(self.horizontal_transition_class_lookup, keys[:, :-1] | classes[:, 1:])
+        v_ids = np.zeros((height, width), dtype=np.uint8)
+        v_ids[:-1] = np.take(self.vertical_transition_class_lookup, keys[:-1] | classes[1:])
+
+        for sprites, textures, new_ids, current_ids in (
+            (
+                self.horizontal_transition_sprites,
+                self.horizontal_transition_texture_table,
+                h_ids.reshape(-1),
+                self.current_horizontal_transition_ids,
+            ),
+            (
+                self.vertical_transition_sprites,
+                self.vertical_transition_texture_table,
+                v_ids.reshape(-1),
+                self.current_vertical_transition_ids,
+            ),
+        ):
+            changed = np.flatnonzero(new_ids != current_ids)
+            if changed.size:
+                _update_changed_textures(
+                    sprites, textures, changed, new_ids[changed], current_ids
                 )
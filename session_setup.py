@@ -7,7 +7,6 @@ Saves to cfg/session.yaml.
 
 import os
 import copy
-import glob
 import yaml
 import arcade
 import numpy as np
@@ -30,10 +29,16 @@ from game_engine.spawn_points import SpawnType
 SPRITES_PATH = os.path.join(os.path.dirname(__file__), "assets", "sprites")
 MAPS_PATH = os.path.join(os.path.dirname(__file__), "assets", "maps")
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 WINDOW_WIDTH = 1708
 WINDOW_HEIGHT = 960
 WINDOW_TITLE = "Session Setup"
 
+# 1x1 transparent texture shared by every SessionSetup window
+TRANSPARENT_TEXTURE = arcade.Texture(Image.new("RGBA", (1, 1), (0, 0, 0, 0)))
+
 DEFAULT_RANDOM_PARAMS = {
     "width": 64,
     "height": 45,
@@ -48,6 +53,23 @@ DEFAULT_RANDOM_PARAMS = {
 }
 
 
+def random_params_signature(params):
+    """Return a hashable snapshot of the random map params that shape the preview.
+
+    Treasure and tool counts are passed to the generator as 0 in preview
+    mode, so changing them does not regenerate the preview. feature_sizes
+    is a list edited in place, so it is frozen into a tuple.
+    """
+    return (
+        params["width"],
+        params["height"],
+        tuple(params["feature_sizes"]),
+        params["threshold"],
+        params["max_rooms"],
+        params["room_chance"],
+    )
+
+
 class FieldType(Enum):
     OPTION = "option"
     NUMERIC = "numeric"
@@ -56,7 +78,21 @@ class FieldType(Enum):
     SAVE = "save"
 
 
-@dataclass
+class ValueFormat(Enum):
+    """How a NUMERIC field's value is displayed."""
+    INTEGER = "integer"
+    PERCENT = "percent"
+    DECIMAL = "decimal"
+
+
+VALUE_FORMATTERS = {
+    ValueFormat.INTEGER: lambda value: str(int(value)),
+    ValueFormat.PERCENT: lambda value: f"{int(round(value * 100))}%",
+    ValueFormat.DECIMAL: lambda value: f"{value:.2f}",
+}
+
+
+@dataclass(slots=True)
 class MenuField:
     """A configurable field in the session setup menu."""
     name: str
@@ -70,6 +106,37 @@ class MenuField:
     max_value: float = 9999
     indent: bool = False
     map_entry_index: int = -1
+    value_format: ValueFormat = ValueFormat.INTEGER
+
+
+# Random map sub-fields in menu order. _make_random_map_fields copies these and
+# fills in the value and owning map entry, in the same order.
+RANDOM_MAP_FIELD_TEMPLATES = (
+    MenuField(name="Width", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=16, max_value=256, indent=True),
+    MenuField(name="Height", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=16, max_value=256, indent=True),
+    MenuField(name="Feature Size 1", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=1, max_value=100, indent=True),
+    MenuField(name="Feature Size 2", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=0, max_value=100, indent=True),
+    MenuField(name="Threshold", field_type=FieldType.NUMERIC, value=0,
+              step=0.05, min_value=-1.0, max_value=1.0, indent=True,
+              value_format=ValueFormat.DECIMAL),
+    MenuField(name="Min Treasure", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=0, max_value=200, indent=True),
+    MenuField(name="Max Treasure", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=0, max_value=200, indent=True),
+    MenuField(name="Min Tools", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=0, max_value=200, indent=True),
+    MenuField(name="Max Tools", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=0, max_value=200, indent=True),
+    MenuField(name="Max Rooms", field_type=FieldType.NUMERIC, value=0,
+              step=1, min_value=0, max_value=20, indent=True),
+    MenuField(name="Room Chance", field_type=FieldType.NUMERIC, value=0,
+              step=0.05, min_value=0.0, max_value=1.0, indent=True,
+              value_format=ValueFormat.DECIMAL),
+)
 
 
 class SessionSetup(arcade.Window):
@@ -86,8 +153,7 @@ class SessionSetup(arcade.Window):
         self.bitmap_text = BitmapText(font_path, zoom=self.zoom)
 
         # Transparent texture needed by TileRenderer
-        transparent_image = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
-        self.transparent_texture = arcade.Texture(transparent_image)
+        self.transparent_texture = TRANSPARENT_TEXTURE
 
         # Discover maps
         self.map_files, self.map_names = self._discover_maps()
@@ -109,6 +175,9 @@ class SessionSetup(arcade.Window):
         # Current field selection
         self.current_field_index = 0
 
+        # Set by key presses; on_update refreshes the menu and preview only then
+        self._ui_dirty = True
+
         # Build the full fields list
         self._rebuild_fields()
 
@@ -118,7 +187,7 @@ class SessionSetup(arcade.Window):
         # Map preview state
         self.map_preview_tile_renderer = None
         self.map_preview_file = None
-        self.map_preview_random_params = None
+        self.map_preview_random_signature = None
         self.random_map_generator = RandomMapGenerator()
 
         # Preview camera on the right side of the window
@@ -136,16 +205,25 @@ class SessionSetup(arcade.Window):
 
     def _discover_maps(self):
         """Scan assets/maps/ for .MNE and .MNL files, append Random Map."""
-        pattern_mne = os.path.join(MAPS_PATH, "*.MNE")
-        pattern_mnl = os.path.join(MAPS_PATH, "*.MNL")
-        files = sorted(glob.glob(pattern_mne)) + sorted(glob.glob(pattern_mnl))
-
-        map_files = []
-        map_names = []
-        for f in files:
-            basename = os.path.basename(f)
-            map_files.append(basename)
-            map_names.append(basename)
+        # One directory pass; MNE maps are listed before MNL maps, each sorted.
+        # normcase keeps the suffix match case-insensitive where the
+        # filesystem is, as the previous glob patterns were.
+        mne_suffix = os.path.normcase(".MNE")
+        mnl_suffix = os.path.normcase(".MNL")
+        mne_files = []
+        mnl_files = []
+        with os.scandir(MAPS_PATH) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                name = os.path.normcase(entry.name)
+                if name.endswith(mne_suffix):
+                    mne_files.append(entry.name)
+                elif name.endswith(mnl_suffix):
+                    mnl_files.append(entry.name)
+
+        map_files = sorted(mne_files) + sorted(mnl_files)
+        map_names = list(map_files)
 
         # Append random map as last option
         map_files.append("RANDOM")
@@ -164,76 +242,108 @@ class SessionSetup(arcade.Window):
         """Create random map sub-fields for a specific map_list entry."""
         params = self.map_list[entry_index]["random_params"]
         feature_sizes = params["feature_sizes"]
-        fields = [
-            MenuField(
-                name="Width", field_type=FieldType.NUMERIC,
-                value=params["width"],
-                step=1, min_value=16, max_value=256, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Height", field_type=FieldType.NUMERIC,
-                value=params["height"],
-                step=1, min_value=16, max_value=256, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Feature Size 1", field_type=FieldType.NUMERIC,
-                value=feature_sizes[0] if len(feature_sizes) > 0 else 20,
-                step=1, min_value=1, max_value=100, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Feature Size 2", field_type=FieldType.NUMERIC,
-                value=feature_sizes[1] if len(feature_sizes) > 1 else 0,
-                step=1, min_value=0, max_value=100, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Threshold", field_type=FieldType.NUMERIC,
-                value=params["threshold"],
-                step=0.05, min_value=-1.0, max_value=1.0, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Min Treasure", field_type=FieldType.NUMERIC,
-                value=params["min_treasure"],
-                step=1, min_value=0, max_value=200, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Max Treasure", field_type=FieldType.NUMERIC,
-                value=params["max_treasure"],
-                step=1, min_value=0, max_value=200, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Min Tools", field_type=FieldType.NUMERIC,
-                value=params["min_tools"],
-                step=1, min_value=0, max_value=200, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Max Tools", field_type=FieldType.NUMERIC,
-                value=params["max_tools"],
-                step=1, min_value=0, max_value=200, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Max Rooms", field_type=FieldType.NUMERIC,
-                value=params["max_rooms"],
-                step=1, min_value=0, max_value=20, indent=True,
-                map_entry_index=entry_index,
-            ),
-            MenuField(
-                name="Room Chance", field_type=FieldType.NUMERIC,
-                value=params["room_chance"],
-                step=0.05, min_value=0.0, max_value=1.0, indent=True,
+        values = (
+            params["width"],
+            params["height"],
+            feature_sizes[0] if len(feature_sizes) > 0 else 20,
+            feature_sizes[1] if len(feature_sizes) > 1 else 0,
+            params["threshold"],
+            params["min_treasure"],
+            params["max_treasure"],
+            params["min_tools"],
+            params["max_tools"],
+            params["max_rooms"],
+            params["room_chance"],
+        )
+        fields = []
+        for template, value in zip(RANDOM_MAP_FIELD_TEMPLATES, values):
+            menu_field = copy.copy(template)
+            menu_field.value = value
+            menu_field.map_entry_index = entry_index
+            fields.append(menu_field)
+        return fields
+
+    def _make_map_entry_fields(self, entry_index):
+        """Create the MAP_ENTRY row of a map_list entry and its random map rows."""
+        entry = self.map_list[entry_index]
+        fields = [MenuField(
+            name=f"Map {entry_index + 1}",
+            field_type=FieldType.MAP_ENTRY,
+            value=entry["file"],
+            options=self.map_files,
+            option_names=self.map_names,
+            selected_option_index=entry["index"],
+            indent=True,
+            map_entry_index=entry_index,
+        )]
+
+        if entry["file"] == "RANDOM":
+            self._ensure_random_params(entry)
+            indicator = "[-]" if entry["expanded"] else "[+]"
+            fields.append(MenuField(
+                name=f"{indicator} Random Map Options",
+                field_type=FieldType.TOGGLE,
+                value=entry["expanded"],
+                indent=True,
                 map_entry_index=entry_index,
-            ),
-        ]
+            ))
+            if entry["expanded"]:
+                fields.extend(self._make_random_map_fields(entry_index))
         return fields
 
+    def _map_entry_span(self, entry_index):
+        """Return the (start, end) range of self.fields owned by a map entry."""
+        start = end = len(self.fixed_fields)
+        for i in range(len(self.fixed_fields), len(self.fields)):
+            menu_field = self.fields[i]
+            if menu_field.field_type == FieldType.SAVE:
+                break
+            if menu_field.map_entry_index == entry_index:
+                if menu_field.field_type == FieldType.MAP_ENTRY:
+                    start = i
+                end = i + 1
+            elif menu_field.map_entry_index > entry_index:
+                break
+            else:
+                start = end = i + 1
+        return start, end
+
+    def _renumber_map_entries(self):
+        """Restamp map entry rows with their map_list index after a splice."""
+        entry_index = -1
+        for menu_field in self.fields[len(self.fixed_fields):]:
+            if menu_field.field_type == FieldType.SAVE:
+                break
+            if menu_field.field_type == FieldType.MAP_ENTRY:
+                entry_index += 1
+                menu_field.name = f"Map {entry_index + 1}"
+            menu_field.map_entry_index = entry_index
+
+    def _insert_map_entry_fields(self, entry_index):
+        """Splice in the rows of a map entry just inserted into map_list."""
+        # Rows still carry the indices from before the insert, so the new
+        # rows go after the previous entry's rows (or first, for index 0)
+        position = self._map_entry_span(entry_index - 1)[1]
+        self.fields[position:position] = self._make_map_entry_fields(entry_index)
+        self._renumber_map_entries()
+
+    def _remove_map_entry_fields(self, entry_index):
+        """Cut out the rows of a map entry just removed from map_list."""
+        start, end = self._map_entry_span(entry_index)
+        del self.fields[start:end]
+        self._renumber_map_entries()
+        if self.current_field_index >= len(self.fields):
+            self.current_field_index = len(self.fields) - 1
+
+    def _swap_map_entry_fields(self, entry_index):
+        """Swap the rows of two adjacent map entries swapped in map_list."""
+        first_start, first_end = self._map_entry_span(entry_index)
+        second_start, second_end = self._map_entry_span(entry_index + 1)
+        self.fields[first_start:second_end] = (
+            self.fields[second_start:second_end] + self.fields[first_start:first_end]
+        )
+        self._renumber_map_entries()
+
     def _rebuild_fields(self):
         """Assemble self.fields from fixed fields + map entries + conditional sub-fields + Save."""
         # Floating market options
@@ -268,6 +378,7 @@ class SessionSetup(arcade.Window):
                 step=0.25,
                 min_value=0.25,
                 max_value=5.0,
+                value_format=ValueFormat.PERCENT,
             ),
             MenuField(
                 name="Speed Multiplier",
@@ -276,6 +387,7 @@ class SessionSetup(arcade.Window):
                 step=0.25,
                 min_value=0.25,
                 max_value=5.0,
+                value_format=ValueFormat.PERCENT,
             ),
             MenuField(
                 name="Spawn type",
@@ -298,33 +410,8 @@ class SessionSetup(arcade.Window):
         self.fields = list(self.fixed_fields)
 
         # Map entry fields (with per-entry random map dropdown)
-        self.map_entry_fields = []
-        for i, entry in enumerate(self.map_list):
-            map_field = MenuField(
-                name=f"Map {i + 1}",
-                field_type=FieldType.MAP_ENTRY,
-                value=entry["file"],
-                options=self.map_files,
-                option_names=self.map_names,
-                selected_option_index=entry["index"],
-                indent=True,
-                map_entry_index=i,
-            )
-            self.map_entry_fields.append(map_field)
-            self.fields.append(map_field)
-
-            if entry["file"] == "RANDOM":
-                self._ensure_random_params(entry)
-                indicator = "[-]" if entry["expanded"] else "[+]"
-                self.fields.append(MenuField(
-                    name=f"{indicator} Random Map Options",
-                    field_type=FieldType.TOGGLE,
-                    value=entry["expanded"],
-                    indent=True,
-                    map_entry_index=i,
-                ))
-                if entry["expanded"]:
-                    self.fields.extend(self._make_random_map_fields(i))
+        for i in range(len(self.map_list)):
+            self.fields.extend(self._make_map_entry_fields(i))
 
         self.fields.append(MenuField(
             name="Save", field_type=FieldType.SAVE,
@@ -341,6 +428,11 @@ class SessionSetup(arcade.Window):
         self.menu_text_sprites = arcade.SpriteList()
         self.instructions_sprites = arcade.SpriteList()
 
+        # Character sprites of each menu text piece, keyed by
+        # (text, x, y, color), so a rebuild only creates sprites for the
+        # pieces that changed.
+        self._menu_text_cache = {}
+
         # Generate instructions text
         self._update_instructions()
 
@@ -354,14 +446,8 @@ class SessionSetup(arcade.Window):
     def _format_value(self, menu_field, is_selected):
         """Format a field's value for display."""
         if menu_field.field_type == FieldType.NUMERIC:
-            val = menu_field.value
-            # Multiplier fields: display as percentage
-            if menu_field.name in ("Damage Multiplier", "Speed Multiplier"):
-                text = f"{int(round(val * 100))}%"
-            elif menu_field.name in ("Threshold", "Room Chance"):
-                text = f"{val:.2f}"
-            else:
-                text = str(int(val))
+            # Multipliers display as percentages, ratios with two decimals
+            text = VALUE_FORMATTERS[menu_field.value_format](menu_field.value)
 
             if is_selected:
                 return f"< {text} >"
@@ -389,9 +475,29 @@ class SessionSetup(arcade.Window):
 
         return ""
 
+    def _menu_text(self, text, x, y, color, cache):
+        """Return the character sprites for a menu text piece.
+
+        Pieces from the previous rebuild are reused from _menu_text_cache;
+        every piece used in this rebuild is recorded in cache.
+        """
+        key = (text, x, y, color)
+        sprites = self._menu_text_cache.get(key)
+        if sprites is None:
+            sprites = self.bitmap_text.create_text_sprites(text, x, y, color=color)
+        cache[key] = sprites
+        return sprites
+
     def _update_menu_text(self):
         """Regenerate menu text sprites."""
-        self.menu_text_sprites = arcade.SpriteList()
+        cache = {}
+        # Refill the one list made in _init_sprite_lists: clear() unregisters
+        # it from the reused sprites, a fresh list per rebuild would not
+        self.menu_text_sprites.clear()
+        # The instructions never change; they share the menu's sprite list so
+        # all setup text goes out in a single draw call. The clear() above also
+        # drops them, so they belong only to that list and instructions_sprites
+        self.menu_text_sprites.extend(self.instructions_sprites)
 
         start_y = self.height - 38 * self.zoom
         line_height = 12 * self.zoom
@@ -399,11 +505,10 @@ class SessionSetup(arcade.Window):
         # Empty map list warning
         if not self.map_list:
             warn_y = start_y - len(self.fixed_fields) * line_height
-            warn_sprites = self.bitmap_text.create_text_sprites(
-                "WARNING: EMPTY MAP LIST", 60, warn_y, color=(255, 100, 60, 255)
+            warn_sprites = self._menu_text(
+                "WARNING: EMPTY MAP LIST", 60, warn_y, (255, 100, 60, 255), cache
             )
-            for s in warn_sprites:
-                self.menu_text_sprites.append(s)
+            self.menu_text_sprites.extend(warn_sprites)
 
         for i, menu_field in enumerate(self.fields):
             y = start_y - i * line_height
@@ -423,11 +528,8 @@ class SessionSetup(arcade.Window):
             label = menu_field.name + ":"
             if menu_field.field_type in (FieldType.SAVE, FieldType.TOGGLE):
                 label = menu_field.name
-            name_sprites = self.bitmap_text.create_text_sprites(
-                label, name_x, y, color=name_color
-            )
-            for s in name_sprites:
-                self.menu_text_sprites.append(s)
+            name_sprites = self._menu_text(label, name_x, y, name_color, cache)
+            self.menu_text_sprites.extend(name_sprites)
 
             # Field value
             value_x = 340
@@ -444,11 +546,11 @@ class SessionSetup(arcade.Window):
                 value_color = (200, 200, 200, 255)
 
             if value_str:
-                value_sprites = self.bitmap_text.create_text_sprites(
-                    value_str, value_x, y, color=value_color
-                )
-                for s in value_sprites:
-                    self.menu_text_sprites.append(s)
+                value_sprites = self._menu_text(value_str, value_x, y, value_color, cache)
+                self.menu_text_sprites.extend(value_sprites)
+
+        # Pieces not shown any more are dropped
+        self._menu_text_cache = cache
 
     def _get_active_map_entry(self):
         """Return the map_list entry that should be previewed based on cursor position."""
@@ -474,17 +576,18 @@ class SessionSetup(arcade.Window):
         if entry is None:
             self.map_preview_tile_renderer = None
             self.map_preview_file = None
-            self.map_preview_random_params = None
+            self.map_preview_random_signature = None
             return
 
         file = entry["file"]
         random_params = entry.get("random_params")
+        random_signature = random_params_signature(random_params) if random_params else None
 
         # Skip reload if same map (and same random params for RANDOM)
         if file == self.map_preview_file:
             if file != "RANDOM":
                 return
-            if random_params == self.map_preview_random_params:
+            if random_signature == self.map_preview_random_signature:
                 return
 
         # Load map data
@@ -503,23 +606,23 @@ class SessionSetup(arcade.Window):
         else:
             map_data = load_map(os.path.join(MAPS_PATH, file))
 
-        # Build RenderState
-        tilemap_np = np.array(map_data.tilemap, dtype=np.uint8).reshape(
+        # Build RenderState. The tilemap is an array.array of bytes, so it is
+        # viewed in place rather than copied element by element; map_data is
+        # not used again, so nothing else writes to it.
+        tilemap_np = np.frombuffer(map_data.tilemap, dtype=np.uint8).reshape(
             map_data.height, map_data.width
         )
         state = RenderState(
             width=map_data.width, height=map_data.height,
             tilemap=tilemap_np,
-            explosions=np.zeros_like(tilemap_np),
+            explosions=np.zeros((map_data.height, map_data.width), dtype=np.uint8),
         )
 
         # Create TileRenderer at zoom=1
         self.map_preview_tile_renderer = TileRenderer(
             state, self.transparent_texture, zoom=1
         )
-        self.map_preview_tile_renderer.on_update(
-            state, 0, state.width, 0, state.height
-        )
+        self.map_preview_tile_renderer.on_update(state)
 
         # Set camera projection centered, matching the game camera pattern
         _, _, preview_w, preview_h = self.map_preview_viewport
@@ -535,10 +638,15 @@ class SessionSetup(arcade.Window):
 
         # Track loaded state
         self.map_preview_file = file
-        self.map_preview_random_params = copy.deepcopy(random_params) if random_params else None
+        self.map_preview_random_signature = random_signature
 
     def on_update(self, delta_time: float):
-        """Update menu text and map preview."""
+        """Update menu text and map preview after the menu changed."""
+        # Menu state and the map list only change on key presses
+        if not self._ui_dirty:
+            return
+        self._ui_dirty = False
+
         # Update menu text
         self._update_menu_text()
 
@@ -553,32 +661,29 @@ class SessionSetup(arcade.Window):
                 self._load_map_preview()
             elif file == "RANDOM":
                 self._ensure_random_params(entry)
-                if entry["random_params"] != self.map_preview_random_params:
+                signature = random_params_signature(entry["random_params"])
+                if signature != self.map_preview_random_signature:
                     self._load_map_preview()
 
     def on_draw(self):
         """Render the setup screen."""
         self.clear()
 
-        # Draw menu text
+        # Draw menu text and instructions
         self.menu_text_sprites.draw(pixelated=True)
 
-        # Draw instructions
-        self.instructions_sprites.draw(pixelated=True)
-
         # Draw map preview
         if self.map_preview_tile_renderer:
             self.map_preview_camera.use()
-            self.map_preview_tile_renderer.background_tile_sprite_list.draw(pixelated=True)
-            self.map_preview_tile_renderer.vertical_transition_sprite_list.draw(pixelated=True)
-            self.map_preview_tile_renderer.horizontal_transition_sprite_list.draw(pixelated=True)
+            self.map_preview_tile_renderer.tilemap_sprite_list.draw()
             self.default_camera.use()
 
     def _find_map_entry_index(self, field):
         """Find the index of a MAP_ENTRY field within self.map_list."""
-        if field not in self.map_entry_fields:
+        # _rebuild_fields stamps every MAP_ENTRY field with its map_list index
+        if field.field_type != FieldType.MAP_ENTRY:
             return -1
-        return self.map_entry_fields.index(field)
+        return field.map_entry_index
 
     def _move_cursor_to_map_entry(self, map_list_index):
         """Move cursor to the MAP_ENTRY field for a given map_list index."""
@@ -589,6 +694,7 @@ class SessionSetup(arcade.Window):
 
     def on_key_press(self, key: int, modifiers: int):
         """Handle key presses."""
+        self._ui_dirty = True
         current_field = self.fields[self.current_field_index]
 
         # MAP_ENTRY edit mode handling
@@ -659,7 +765,7 @@ class SessionSetup(arcade.Window):
                         self.map_list[map_idx - 1], self.map_list[map_idx]
                     )
                     new_map_idx = map_idx - 1
-                    self._rebuild_fields()
+                    self._swap_map_entry_fields(new_map_idx)
                     self._move_cursor_to_map_entry(new_map_idx)
 
         elif key == arcade.key.RIGHT:
@@ -683,7 +789,7 @@ class SessionSetup(arcade.Window):
                         self.map_list[map_idx + 1], self.map_list[map_idx]
                     )
                     new_map_idx = map_idx + 1
-                    self._rebuild_fields()
+                    self._swap_map_entry_fields(map_idx)
                     self._move_cursor_to_map_entry(new_map_idx)
 
         elif key == arcade.key.ENTER:
@@ -708,7 +814,7 @@ class SessionSetup(arcade.Window):
                 new_entry = copy.deepcopy(self.map_list[map_idx])
                 new_entry.pop("expanded", None)
                 self.map_list.insert(map_idx + 1, new_entry)
-                self._rebuild_fields()
+                self._insert_map_entry_fields(map_idx + 1)
                 self._move_cursor_to_map_entry(map_idx + 1)
             else:
                 # Insert relative to owning map entry, or append to end
@@ -727,7 +833,7 @@ class SessionSetup(arcade.Window):
                     new_entry = {"file": self.map_files[0], "index": 0}
                     self.map_list.append(new_entry)
                     new_idx = 0
-                self._rebuild_fields()
+                self._insert_map_entry_fields(new_idx)
                 self._move_cursor_to_map_entry(new_idx)
 
         elif key in (arcade.key.DELETE, arcade.key.MINUS, arcade.key.NUM_SUBTRACT):
@@ -735,7 +841,7 @@ class SessionSetup(arcade.Window):
             if current_field.field_type == FieldType.MAP_ENTRY:
                 map_idx = self._find_map_entry_index(current_field)
                 self.map_list.pop(map_idx)
-                self._rebuild_fields()
+                self._remove_map_entry_fields(map_idx)
 
     def _sync_field_to_state(self, changed_field):
         """Sync a changed field value back to internal state and rebuild if needed."""
@@ -797,7 +903,7 @@ class SessionSetup(arcade.Window):
 
         try:
             with open(yaml_path, "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YAML_LOADER)
         except (yaml.YAMLError, IOError):
             return
 